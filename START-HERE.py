@@ -86,17 +86,23 @@ if not ffmpeg_available:
     print()
 
 # Install dependencies
+# Non-interactive pip without the self-update check; prefer wheels over
+# source builds (whisper itself only ships an sdist, so not --only-binary)
+os.environ.setdefault("PIP_NO_INPUT", "1")
+os.environ.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--prefer-binary", "-q"]
+
 print("[SETUP] Installing core dependencies...")
 subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip", "-q"], capture_output=True)
-subprocess.run([sys.executable, "-m", "pip", "install", "flask", "requests", "-q"])
+subprocess.run(PIP_INSTALL + ["flask", "requests"])
 
 print("[SETUP] Installing optional dependencies...")
-subprocess.run([sys.executable, "-m", "pip", "install", "yt-dlp", "-q"], capture_output=True)
+subprocess.run(PIP_INSTALL + ["yt-dlp"], capture_output=True)
 
 # Install whisper for transcription
 if ffmpeg_available:
     print("[SETUP] Installing transcription support (this may take a minute)...")
-    result = subprocess.run([sys.executable, "-m", "pip", "install", "openai-whisper", "-q"], capture_output=True)
+    result = subprocess.run(PIP_INSTALL + ["openai-whisper"], capture_output=True)
     if result.returncode == 0:
         print("[OK] Whisper installed - transcription enabled!")
     else:
@@ -144,6 +150,6 @@ def open_browser():
 import threading
 threading.Thread(target=open_browser, daemon=True).start()
 
-# Start Flask (import and run)
-from app import app
-app.run(host="0.0.0.0", port=5001, debug=False)
+# Start server (waitress when installed, Flask dev server otherwise)
+from app import run_server
+run_server(host="0.0.0.0", port=5001)
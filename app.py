@@ -7,24 +7,35 @@ V2.0 - Robust error handling, persistent state, comprehensive logging
 
 import json
 import os
+import re
+import stat
 import uuid
+import heapq
+import hashlib
 import subprocess
 import time
 import atexit
+import threading
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from threading import Thread
+from concurrent.futures import ThreadPoolExecutor, wait
 
-from flask import Flask, render_template, request, jsonify, send_file, Response
+from flask import Flask, render_template, request, jsonify, send_file, Response, g
 import requests as http_requests
+from requests.adapters import HTTPAdapter
 
 # Import scrapers
-from scraper.core import run_scrape, WHISPER_AVAILABLE, download_video, create_session
+from scraper.core import run_scrape, WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE, download_video, create_session
 from scraper.tiktok import run_tiktok_scrape
 
 # Import utilities for robust error handling
 from utils import get_logger, ScrapeStateManager, ScrapePhase, ScrapeState
 from utils import check_for_updates, run_update, get_current_version, get_git_status
+from utils import json_dumps, json_loads, HistoryStore, summarize_entry, atomic_write_bytes
+from utils.rewrite_cache import RewriteCache
 
 # Import skeleton ripper
 from skeleton_ripper import (
@@ -43,12 +54,20 @@ BASE_DIR = Path(__file__).parent.resolve()
 # Initialize logger and state manager
 logger = get_logger()
 state_manager = ScrapeStateManager(BASE_DIR / "state")
+rewrite_cache = RewriteCache(BASE_DIR / "state" / "rewrite_cache.db")
 
 # Initialize Flask with explicit paths
 app = Flask(__name__,
             static_folder=str(BASE_DIR / 'static'),
             template_folder=str(BASE_DIR / 'templates'))
 app.secret_key = os.urandom(24)
+# Compact, unsorted jsonify() output - Flask pretty-prints in debug mode otherwise
+if hasattr(app, 'json') and hasattr(app.json, 'compact'):
+    app.json.compact = True
+    app.json.sort_keys = False
+else:  # Flask < 2.2
+    app.config['JSON_SORT_KEYS'] = False
+    app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
 OUTPUT_DIR = BASE_DIR / "output"
 TIKTOK_OUTPUT_DIR = BASE_DIR / "output_tiktok"
 COOKIES_FILE = BASE_DIR / "cookies.txt"
@@ -66,7 +85,8 @@ DEFAULT_CONFIG = {
     'openai_key': '',
     'anthropic_key': '',
     'google_key': '',
-    'output_directory': ''  # Empty = use default (BASE_DIR/output)
+    'output_directory': '',  # Empty = use default (BASE_DIR/output)
+    'prefetch_rewrites': False  # Warm the rewrite cache for top reels after each scrape
 }
 
 # Universal prompt template
@@ -86,14 +106,61 @@ ORIGINAL ({views:,} views):
 # Active scrapes (for progress tracking)
 # Now backed by persistent state_manager for crash recovery
 active_scrapes = {}
+_SCRAPES_LOCK = threading.Lock()
+# Signalled whenever an active scrape changes; each scrape carries a 'version'
+# counter so SSE streams and ETags can tell what changed
+_SCRAPE_UPDATES = threading.Condition(_SCRAPES_LOCK)
+
+# Seconds between SSE keep-alive comments while a scrape is quiet
+SCRAPE_EVENTS_KEEPALIVE = 15
+
+# Scrape states after which no further updates arrive
+SCRAPE_TERMINAL_STATES = ('complete', 'partial', 'error', 'aborted')
+
+# Bounded worker pool for scrapes - extra requests queue instead of spawning threads
+_SCRAPE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scrape')
+
+# Finished scrapes stay in memory this long for status polling, then fall back
+# to the persistent state_manager
+SCRAPE_RESULT_TTL = 600  # seconds
+
+
+def _notify_scrape_update(scrape_id):
+    """Bump a scrape's version and wake any SSE streams waiting on it"""
+    with _SCRAPE_UPDATES:
+        scrape = active_scrapes.get(scrape_id)
+        if scrape is not None:
+            scrape['version'] = scrape.get('version', 0) + 1
+        _SCRAPE_UPDATES.notify_all()
+
+
+def _evict_scrape(scrape_id):
+    """Drop a finished scrape from the in-memory cache"""
+    with _SCRAPES_LOCK:
+        active_scrapes.pop(scrape_id, None)
+
+
+def _schedule_scrape_eviction(scrape_id):
+    """Done-callback for scrape futures: evict after SCRAPE_RESULT_TTL"""
+    def callback(_future):
+        timer = threading.Timer(SCRAPE_RESULT_TTL, _evict_scrape, args=(scrape_id,))
+        timer.daemon = True
+        timer.start()
+    return callback
+
 
 # Cleanup handler for graceful shutdown
 def cleanup_on_exit():
     """Mark any running scrapes as interrupted on server shutdown"""
     logger.info("SYSTEM", "Server shutting down, cleaning up active scrapes")
-    for scrape_id in list(active_scrapes.keys()):
-        if active_scrapes[scrape_id].get('status') in ('starting', 'running'):
-            state_manager.abort_job(scrape_id, "Server shutdown")
+    with _SCRAPES_LOCK:
+        running = [scrape_id for scrape_id, scrape in active_scrapes.items()
+                   if scrape.get('status') in ('starting', 'running')]
+    for scrape_id in running:
+        state_manager.abort_job(scrape_id, "Server shutdown")
+    _SCRAPE_POOL.shutdown(wait=False, cancel_futures=True)
+    _PREFETCH_POOL.shutdown(wait=False, cancel_futures=True)
+    _VIDEO_SCAN_POOL.shutdown(wait=False, cancel_futures=True)
 
 atexit.register(cleanup_on_exit)
 
@@ -102,21 +169,24 @@ def load_config():
     """Load configuration from JSON file"""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                saved = json.load(f)
-                # Merge with defaults to handle new fields
-                config = DEFAULT_CONFIG.copy()
-                config.update(saved)
-                return config
+            saved = json_loads(CONFIG_FILE.read_bytes())
+            # Merge with defaults to handle new fields
+            config = DEFAULT_CONFIG.copy()
+            config.update(saved)
+            return config
         except:
             pass
     return DEFAULT_CONFIG.copy()
 
 
 def save_config(config):
-    """Save configuration to JSON file"""
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    """Save configuration to JSON file (kept pretty-printed for hand editing)"""
+    atomic_write_bytes(CONFIG_FILE, json_dumps(config, pretty=True))
+
+
+def json_response(obj, status=200):
+    """Fast replacement for jsonify() using orjson when available"""
+    return Response(json_dumps(obj), status=status, mimetype='application/json')
 
 
 def get_output_directory(platform='instagram'):
@@ -132,28 +202,97 @@ def get_output_directory(platform='instagram'):
     return TIKTOK_OUTPUT_DIR if platform == 'tiktok' else OUTPUT_DIR
 
 
+def _get_output_directory(platform='instagram'):
+    """Request-scoped get_output_directory() - config is read once per platform per request"""
+    if 'output_dirs' not in g:
+        g.output_dirs = {}
+    if platform not in g.output_dirs:
+        g.output_dirs[platform] = get_output_directory(platform)
+    return g.output_dirs[platform]
+
+
+@lru_cache(maxsize=8)
+def _resolve_root_prefixes(roots):
+    """Resolved output roots as 'dir/' string prefixes (cached per distinct set of roots)"""
+    return tuple(dict.fromkeys(os.path.join(str(Path(root).resolve()), '') for root in roots))
+
+
+def _output_root_prefixes():
+    """Prefixes a served/deleted video path must start with (configured + default dirs)"""
+    return _resolve_root_prefixes((
+        _get_output_directory('instagram'),
+        _get_output_directory('tiktok'),
+        OUTPUT_DIR,
+        TIKTOK_OUTPUT_DIR
+    ))
+
+
+def _create_llm_session():
+    """Create a keep-alive session whose pool is sized for concurrent rewrites"""
+    session = http_requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# One pooled session per LLM provider so repeated calls reuse TCP/TLS connections
+_LLM_SESSIONS = {
+    provider: _create_llm_session()
+    for provider in ('ollama', 'openai', 'anthropic', 'google')
+}
+
+
+# The settings panel asks for models every time it opens; the list rarely
+# changes. Failures expire sooner so a freshly started Ollama shows up quickly.
+OLLAMA_MODELS_TTL = 30  # seconds
+OLLAMA_MODELS_FAILURE_TTL = 5  # seconds
+_ollama_models_cache = {'models': None, 'expires': 0.0}
+
+
 def get_ollama_models():
-    """Get list of available Ollama models"""
+    """Get list of available Ollama models (cached for OLLAMA_MODELS_TTL)"""
+    now = time.monotonic()
+    if _ollama_models_cache['models'] is not None and now < _ollama_models_cache['expires']:
+        return list(_ollama_models_cache['models'])
+
+    models = []
     try:
-        resp = http_requests.get('http://localhost:11434/api/tags', timeout=5)
+        resp = _LLM_SESSIONS['ollama'].get('http://localhost:11434/api/tags', timeout=5)
         if resp.status_code == 200:
             data = resp.json()
-            models = [m['name'] for m in data.get('models', [])]
-            return sorted(models)
+            models = sorted(m['name'] for m in data.get('models', []))
     except:
         pass
-    return []
+
+    ttl = OLLAMA_MODELS_TTL if models else OLLAMA_MODELS_FAILURE_TTL
+    _ollama_models_cache.update(models=models, expires=now + ttl)
+    return list(models)
+
+
+# UNIVERSAL_PROMPT_TEMPLATE split once around its two fields, so prompts are
+# built by concatenation instead of re-parsing the template with str.format
+_PROMPT_HEAD, _PROMPT_REST = UNIVERSAL_PROMPT_TEMPLATE.split('{views:,}', 1)
+_PROMPT_MID, _PROMPT_TAIL = _PROMPT_REST.split('{transcript}', 1)
+
+
+@lru_cache(maxsize=512)
+def _format_prompt(transcript, views):
+    """Format the prompt template - memoized since batch/repeat rewrites reuse reels"""
+    return ''.join((_PROMPT_HEAD, format(views, ','), _PROMPT_MID, transcript, _PROMPT_TAIL))
 
 
 def generate_ai_prompt(reel):
     """Generate a universal AI prompt for rewriting a transcript"""
     transcript = reel.get('transcript') or reel.get('caption') or 'No transcript available'
-    return UNIVERSAL_PROMPT_TEMPLATE.format(
-        views=reel.get('views', 0),
-        likes=reel.get('likes', 0),
-        transcript=transcript,
-        url=reel.get('url', '')
-    )
+    return _format_prompt(transcript, reel.get('views', 0))
+
+
+# Thinking-model output patterns (compiled once, reused for every response)
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL | re.IGNORECASE)
+_THINKING_RE = re.compile(r'<thinking>.*?</thinking>', re.DOTALL | re.IGNORECASE)
+_THINK_PREFIX_RE = re.compile(r'^.*?</think>', re.DOTALL | re.IGNORECASE)
+_THINKING_PREFIX_RE = re.compile(r'^.*?</thinking>', re.DOTALL | re.IGNORECASE)
 
 
 def strip_thinking_output(text):
@@ -161,19 +300,22 @@ def strip_thinking_output(text):
     Strip thinking model output (DeepSeek, etc.) from responses.
     Removes <think>...</think> blocks and similar patterns.
     """
-    import re
     if not text:
         return text
 
+    # Fast path: non-reasoning models never emit think tags
+    if '</think' not in text.lower():
+        return text.strip()
+
     # Remove <think>...</think> blocks (DeepSeek R1, etc.)
-    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _THINK_RE.sub('', text)
 
     # Remove <thinking>...</thinking> blocks (alternative format)
-    text = re.sub(r'<thinking>.*?</thinking>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _THINKING_RE.sub('', text)
 
     # Remove any remaining unclosed thinking tags and content before actual response
-    text = re.sub(r'^.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'^.*?</thinking>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _THINK_PREFIX_RE.sub('', text)
+    text = _THINKING_PREFIX_RE.sub('', text)
 
     return text.strip()
 
@@ -181,7 +323,7 @@ def strip_thinking_output(text):
 def call_ollama(prompt, model):
     """Call Ollama API for local LLM"""
     try:
-        resp = http_requests.post(
+        resp = _LLM_SESSIONS['ollama'].post(
             'http://localhost:11434/api/generate',
             json={'model': model, 'prompt': prompt, 'stream': False},
             timeout=120
@@ -194,10 +336,59 @@ def call_ollama(prompt, model):
     return "Error: Failed to get response from Ollama"
 
 
+def stream_ollama(prompt, model):
+    """Yield raw response text chunks from Ollama as they are generated"""
+    with _LLM_SESSIONS['ollama'].post(
+        'http://localhost:11434/api/generate',
+        json={'model': model, 'prompt': prompt, 'stream': True},
+        stream=True,
+        timeout=120
+    ) as resp:
+        if resp.status_code != 200:
+            raise RuntimeError(f"Ollama returned status {resp.status_code}")
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            chunk = json_loads(line)
+            if chunk.get('response'):
+                yield chunk['response']
+            if chunk.get('done'):
+                break
+
+
+def sse_event(payload):
+    """Format a payload as a Server-Sent Events data frame"""
+    return b'data: ' + json_dumps(payload) + b'\n\n'
+
+
+def stream_ollama_events(prompt, model, semantic_parts=(), scope=''):
+    """
+    SSE stream for a local rewrite: one {'chunk'} event per token batch, then
+    a final {'done', 'result'} event with thinking output stripped.
+    """
+    parts = []
+    try:
+        for chunk in stream_ollama(prompt, model):
+            parts.append(chunk)
+            yield sse_event({'chunk': chunk})
+    except Exception as e:
+        yield sse_event({'error': f"Error: {e}"})
+        return
+    result = strip_thinking_output(''.join(parts))
+    if result:
+        rewrite_cache.set('local', model, prompt, result, parts=semantic_parts, scope=scope)
+    yield sse_event({
+        'done': True,
+        'result': result,
+        'provider': 'local',
+        'model': model
+    })
+
+
 def call_openai(prompt, model, api_key):
     """Call OpenAI API"""
     try:
-        resp = http_requests.post(
+        resp = _LLM_SESSIONS['openai'].post(
             'https://api.openai.com/v1/chat/completions',
             headers={
                 'Authorization': f'Bearer {api_key}',
@@ -222,7 +413,7 @@ def call_openai(prompt, model, api_key):
 def call_anthropic(prompt, model, api_key):
     """Call Anthropic API"""
     try:
-        resp = http_requests.post(
+        resp = _LLM_SESSIONS['anthropic'].post(
             'https://api.anthropic.com/v1/messages',
             headers={
                 'x-api-key': api_key,
@@ -249,7 +440,7 @@ def call_google(prompt, model, api_key):
     """Call Google Gemini API"""
     try:
         url = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}'
-        resp = http_requests.post(
+        resp = _LLM_SESSIONS['google'].post(
             url,
             headers={'Content-Type': 'application/json'},
             json={
@@ -266,21 +457,221 @@ def call_google(prompt, model, api_key):
         return f"Error: {e}"
 
 
+def call_provider(provider, prompt, model, api_key=None):
+    """Dispatch a prompt to the given provider's call_* function"""
+    if provider == 'local':
+        return call_ollama(prompt, model)
+    if provider == 'openai':
+        return call_openai(prompt, model, api_key)
+    if provider == 'anthropic':
+        return call_anthropic(prompt, model, api_key)
+    if provider == 'google':
+        return call_google(prompt, model, api_key)
+    return f"Error: Unknown provider: {provider}"
+
+
+def cached_rewrite(provider, model, prompt, api_key=None, semantic_parts=(), use_cache=True, scope=''):
+    """
+    Call the LLM through the rewrite cache. Exact repeats (and near-identical
+    transcript + context pairs for the same reel scope) are served without a
+    provider round-trip. Returns (result, cached).
+    """
+    if use_cache:
+        cached = rewrite_cache.get(provider, model, prompt, parts=semantic_parts, scope=scope)
+        if cached is not None:
+            return cached, True
+
+    result = call_provider(provider, prompt, model, api_key)
+    # call_* functions report failures as "Error: ..." strings - never cache those
+    if result and not result.startswith('Error'):
+        rewrite_cache.set(provider, model, prompt, result, parts=semantic_parts, scope=scope)
+    return result, False
+
+
+# Background rewrites that warm the rewrite cache right after a scrape
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='prefetch')
+
+
+def prefetch_rewrites(result):
+    """
+    Queue rewrites for a finished scrape's top reels so the user's first
+    /api/rewrite calls are cache hits. Opt-in via config 'prefetch_rewrites'.
+    """
+    config = load_config()
+    if not config.get('prefetch_rewrites'):
+        return
+    provider = config.get('ai_provider', 'copy')
+    if provider == 'copy':
+        return
+    model, api_key, error = resolve_rewrite_model(provider, None, config)
+    if error:
+        logger.debug("API", f"Skipping rewrite prefetch: {error}")
+        return
+
+    reels = [r for r in result.get('top_reels', []) if r.get('transcript') or r.get('caption')]
+    for reel in reels:
+        base_prompt, full_prompt = build_rewrite_prompt(reel)
+        _PREFETCH_POOL.submit(cached_rewrite, provider, model, full_prompt, api_key,
+                              semantic_parts=(base_prompt, ''), scope=reel.get('shortcode') or '')
+    logger.info("API", f"Prefetching {len(reels)} rewrites via {provider}/{model}")
+
+
+# Per-scrape history files (history/<id>.json) plus a small index. The index is
+# held in memory; full entries are read from their own file on first access.
+# Mutations mark the touched scrape dirty and schedule one coalesced flush.
+history_store = HistoryStore(BASE_DIR / "history", legacy_file=HISTORY_FILE)
+
+HISTORY_FLUSH_DELAY = 0.5  # seconds
+HISTORY_MAX_ENTRIES = 50
+_history_lock = threading.RLock()
+_history_index = None  # summaries, newest first
+_history_by_id = {}  # scrape_id -> full entry, filled on demand
+_history_dirty = set()  # scrape files to rewrite on next flush
+_history_deleted = set()  # scrape files to remove on next flush
+_history_flush_timer = None
+_history_version = 0  # bumped on every mutation; keys derived caches
+
+
+def _ensure_history_loaded():
+    """Load the history index on first access (caller holds lock)"""
+    global _history_index
+    if _history_index is None:
+        _history_index = history_store.load_index()
+
+
+def load_history_index():
+    """Get history summaries ({id, username, timestamp, top_count, ...}), newest first"""
+    with _history_lock:
+        _ensure_history_loaded()
+        return list(_history_index)
+
+
+def load_scrape(scrape_id):
+    """Get one full history entry, reading only its own file on first access"""
+    with _history_lock:
+        _ensure_history_loaded()
+        entry = _history_by_id.get(scrape_id)
+        if entry is None and any(item.get('id') == scrape_id for item in _history_index):
+            entry = history_store.load_scrape(scrape_id)
+            if entry is not None:
+                _history_by_id[scrape_id] = entry
+        return entry
+
+
 def load_history():
-    """Load scrape history from JSON file"""
-    if HISTORY_FILE.exists():
-        try:
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+    """Get full scrape history entries, newest first"""
+    with _history_lock:
+        _ensure_history_loaded()
+        entries = (load_scrape(item.get('id')) for item in _history_index)
+        return [entry for entry in entries if entry is not None]
 
 
-def save_history(history):
-    """Save scrape history to JSON file"""
-    with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+def _get_history():
+    """Request-scoped history handle - load_history() runs at most once per request"""
+    if 'history' not in g:
+        g.history = load_history()
+    return g.history
+
+
+def find_reel(scrape_id, shortcode):
+    """
+    O(1) lookup of (scrape, reel, index) for a scrape_id/shortcode pair.
+    Reels are indexed on flask.g the first time a scrape is touched in a request.
+    Returns (None, None, None) when the scrape is missing, (scrape, None, None)
+    when the reel is missing.
+    """
+    scrape = load_scrape(scrape_id)
+    if scrape is None:
+        return None, None, None
+
+    if 'reel_index' not in g:
+        g.reel_index = {}
+        g.indexed_scrapes = set()
+    if scrape_id not in g.indexed_scrapes:
+        for idx, r in enumerate(scrape.get('top_reels', [])):
+            g.reel_index.setdefault((scrape_id, r.get('shortcode')), (scrape, r, idx))
+        g.indexed_scrapes.add(scrape_id)
+
+    return g.reel_index.get((scrape_id, shortcode), (scrape, None, None))
+
+
+def save_scrape(entry):
+    """Schedule a write of one (in-place edited) history entry"""
+    scrape_id = entry.get('id')
+    with _history_lock:
+        _ensure_history_loaded()
+        _history_by_id[scrape_id] = entry
+        for i, item in enumerate(_history_index):
+            if item.get('id') == scrape_id:
+                _history_index[i] = summarize_entry(entry)
+                break
+        _history_dirty.add(scrape_id)
+        _schedule_history_flush()
+
+
+def _drop_scrape(scrape_id):
+    """Forget a scrape in memory and queue its file for removal (caller holds lock)"""
+    _history_by_id.pop(scrape_id, None)
+    _history_dirty.discard(scrape_id)
+    _history_deleted.add(scrape_id)
+
+
+def delete_scrape(scrape_id):
+    """Remove one scrape from history. Returns False if it wasn't there."""
+    with _history_lock:
+        _ensure_history_loaded()
+        for i, item in enumerate(_history_index):
+            if item.get('id') == scrape_id:
+                del _history_index[i]
+                _drop_scrape(scrape_id)
+                _schedule_history_flush()
+                return True
+    return False
+
+
+def clear_all_history():
+    """Remove every scrape from history"""
+    with _history_lock:
+        _ensure_history_loaded()
+        for item in _history_index:
+            _drop_scrape(item.get('id'))
+        _history_index.clear()
+        _schedule_history_flush()
+
+
+def _schedule_history_flush():
+    """Coalesce writes: the first mutation starts the timer, later ones ride along"""
+    global _history_flush_timer, _history_version
+    with _history_lock:
+        # Every mutation lands here, so this is also where derived caches are invalidated
+        _history_version += 1
+        if _history_flush_timer is None:
+            _history_flush_timer = threading.Timer(HISTORY_FLUSH_DELAY, flush_history)
+            _history_flush_timer.daemon = True
+            _history_flush_timer.start()
+
+
+def flush_history():
+    """Write dirty scrape files, remove deleted ones, then rewrite the index"""
+    global _history_flush_timer
+    with _history_lock:
+        if _history_flush_timer is not None:
+            _history_flush_timer.cancel()
+            _history_flush_timer = None
+        if _history_index is None or not (_history_dirty or _history_deleted):
+            return
+        for scrape_id in _history_deleted:
+            history_store.delete_scrape(scrape_id)
+        for scrape_id in _history_dirty:
+            entry = _history_by_id.get(scrape_id)
+            if entry is not None:
+                history_store.write_scrape(entry)
+        _history_deleted.clear()
+        _history_dirty.clear()
+        history_store.write_index(_history_index)
+
+
+atexit.register(flush_history)
 
 
 def add_to_history(scrape_result, include_errors: bool = False):
@@ -288,7 +679,6 @@ def add_to_history(scrape_result, include_errors: bool = False):
     Add a scrape result to history.
     Now saves ALL results including errors and partial completions.
     """
-    history = load_history()
     platform = scrape_result.get('platform', 'instagram')
     top_reels = scrape_result.get('top_reels', []) or scrape_result.get('top_videos', [])
     status = scrape_result.get('status', 'unknown')
@@ -320,17 +710,25 @@ def add_to_history(scrape_result, include_errors: bool = False):
         entry['error_code'] = scrape_result.get('error_code')
         entry['error'] = scrape_result.get('error')
 
-    history.insert(0, entry)
-    # Keep last 50 scrapes
-    history = history[:50]
-    save_history(history)
-    logger.info("HISTORY", f"Saved history with {len(history)} entries")
+    with _history_lock:
+        _ensure_history_loaded()
+        _history_index.insert(0, summarize_entry(entry))
+        _history_by_id[entry['id']] = entry
+        _history_dirty.add(entry['id'])
+        _history_deleted.discard(entry['id'])
+        # Keep last 50 scrapes
+        for old in _history_index[HISTORY_MAX_ENTRIES:]:
+            _drop_scrape(old.get('id'))
+        del _history_index[HISTORY_MAX_ENTRIES:]
+        _schedule_history_flush()
+        count = len(_history_index)
+    logger.info("HISTORY", f"Saved history with {count} entries")
 
 
 @app.route('/')
 def index():
     """Main page"""
-    history = load_history()
+    history = load_history_index()
     cookies_exist = COOKIES_FILE.exists()
     tiktok_cookies_exist = TIKTOK_COOKIES_FILE.exists()
     return render_template('index.html',
@@ -374,6 +772,13 @@ def start_scrape():
             'error_code': error_code
         }), 400
 
+    # Counts are passed down as ints so ranking never compares mixed types
+    try:
+        max_reels = int(data.get('max_reels', 50 if platform == 'tiktok' else 100))
+        top_n = int(data.get('top_n', 10))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'max_reels and top_n must be integers'}), 400
+
     # Create scrape ID
     scrape_id = str(uuid.uuid4())
     logger.info("SCRAPE", f"Creating scrape job for @{username} on {platform}", {
@@ -386,8 +791,8 @@ def start_scrape():
     scrape_config = {
         'username': username,
         'platform': platform,
-        'max_reels': data.get('max_reels', 100),
-        'top_n': data.get('top_n', 10),
+        'max_reels': max_reels,
+        'top_n': top_n,
         'download': data.get('download', False),
         'transcribe': data.get('transcribe', False),
         'transcribe_provider': data.get('transcribe_provider', 'local'),
@@ -396,16 +801,18 @@ def start_scrape():
     state_manager.create_job(scrape_id, username, platform, scrape_config)
 
     # Also maintain in-memory cache for fast access
-    active_scrapes[scrape_id] = {
-        'status': 'starting',
-        'progress': f'Initializing {platform.title()} scrape...',
-        'progress_pct': 0,
-        'phase': 'initializing',
-        'result': None,
-        'platform': platform,
-        'errors': []
-    }
-    logger.debug("SCRAPE", f"Active scrapes: {list(active_scrapes.keys())}")
+    with _SCRAPES_LOCK:
+        active_scrapes[scrape_id] = {
+            'status': 'starting',
+            'progress': f'Initializing {platform.title()} scrape...',
+            'progress_pct': 0,
+            'phase': 'initializing',
+            'result': None,
+            'platform': platform,
+            'errors': [],
+            'version': 0
+        }
+        logger.debug("SCRAPE", f"Active scrapes: {list(active_scrapes.keys())}")
 
     # Get transcription settings
     transcribe_provider = data.get('transcribe_provider', 'local')
@@ -443,6 +850,7 @@ def start_scrape():
                 elif progress_pct is not None:
                     active_scrapes[scrape_id]['progress_pct'] = progress_pct
 
+                _notify_scrape_update(scrape_id)
                 logger.progress(scrape_id, active_scrapes[scrape_id].get('phase', 'processing'),
                               progress_pct or 0, msg)
             except Exception as e:
@@ -460,6 +868,7 @@ def start_scrape():
             accumulated_errors.append(error_entry)
             active_scrapes[scrape_id]['errors'] = accumulated_errors
             state_manager.add_error(scrape_id, code, error_msg, is_fatal)
+            _notify_scrape_update(scrape_id)
 
         try:
             logger.scrape_event(scrape_id, "Starting scrape", {"platform": platform, "username": username})
@@ -469,8 +878,8 @@ def start_scrape():
                 result = run_tiktok_scrape(
                     username=username,
                     cookies_path=str(TIKTOK_COOKIES_FILE),
-                    max_videos=data.get('max_reels', 50),
-                    top_n=data.get('top_n', 10),
+                    max_videos=max_reels,
+                    top_n=top_n,
                     download=data.get('download', False),
                     transcribe=data.get('transcribe', False),
                     whisper_model=data.get('whisper_model', 'small.en'),
@@ -485,8 +894,8 @@ def start_scrape():
                 result = run_scrape(
                     username=username,
                     cookies_path=str(COOKIES_FILE),
-                    max_reels=data.get('max_reels', 100),
-                    top_n=data.get('top_n', 10),
+                    max_reels=max_reels,
+                    top_n=top_n,
                     download=data.get('download', False),
                     transcribe=data.get('transcribe', False),
                     whisper_model=data.get('whisper_model', 'small.en'),
@@ -516,6 +925,13 @@ def start_scrape():
 
             # ALWAYS save to history now (including errors and partial results)
             add_to_history(result, include_errors=True)
+            _notify_scrape_update(scrape_id)
+
+            if result.get('status') != 'error':
+                try:
+                    prefetch_rewrites(result)
+                except Exception as e:
+                    logger.warning("API", f"Rewrite prefetch failed: {e}")
 
             logger.scrape_event(scrape_id, "Scrape completed", {
                 "status": result.get('status'),
@@ -551,9 +967,12 @@ def start_scrape():
 
             # Save error to history so user can see what happened
             add_to_history(active_scrapes[scrape_id]['result'], include_errors=True)
+            _notify_scrape_update(scrape_id)
 
-    thread = Thread(target=run_in_background, daemon=True)
-    thread.start()
+    future = _SCRAPE_POOL.submit(run_in_background)
+    with _SCRAPES_LOCK:
+        active_scrapes[scrape_id]['future'] = future
+    future.add_done_callback(_schedule_scrape_eviction(scrape_id))
 
     return jsonify({'scrape_id': scrape_id, 'platform': platform})
 
@@ -562,15 +981,22 @@ def start_scrape():
 def scrape_status(scrape_id):
     """Get scrape status - checks memory first, then persistent state"""
     # First check in-memory active scrapes
-    if scrape_id in active_scrapes:
-        scrape = active_scrapes[scrape_id]
-        return jsonify({
+    with _SCRAPES_LOCK:
+        scrape = active_scrapes.get(scrape_id)
+    if scrape is not None:
+        # Unchanged since the client's last poll: 304 without re-serializing the result
+        etag = f"{scrape_id}-{scrape.get('version', 0)}"
+        if request.if_none_match.contains(etag):
+            return _not_modified(etag)
+        response = json_response({
             'status': scrape['status'],
             'progress': scrape['progress'],
             'result': scrape['result'],
             'error_code': scrape.get('error_code'),
             'error_message': scrape.get('error_message')
         })
+        response.set_etag(etag)
+        return response
 
     # Fallback to persistent state manager (handles server restarts)
     job_status = state_manager.get_job_status(scrape_id)
@@ -578,7 +1004,14 @@ def scrape_status(scrape_id):
         logger.debug("API", f"Scrape {scrape_id} recovered from persistent state", {
             "status": job_status.get('status')
         })
-        return jsonify({
+        etag = hashlib.blake2b(repr((
+            job_status['status'], job_status['progress'], job_status.get('progress_pct'),
+            job_status.get('phase'), job_status.get('current_item'),
+            len(job_status.get('errors') or []), job_status.get('error_code')
+        )).encode('utf-8'), digest_size=12).hexdigest()
+        if request.if_none_match.contains(etag):
+            return _not_modified(etag)
+        response = json_response({
             'status': job_status['status'],
             'progress': job_status['progress'],
             'progress_pct': job_status.get('progress_pct', 0),
@@ -590,17 +1023,90 @@ def scrape_status(scrape_id):
             'error_message': job_status.get('error_message'),
             'errors': job_status.get('errors', [])
         })
+        response.set_etag(etag)
+        return response
 
     logger.warning("API", f"Scrape {scrape_id} not found in memory or persistent state")
     return jsonify({'error': 'Scrape not found', 'error_code': 'SCRAPE-NOT-FOUND'}), 404
 
 
+def _not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def scrape_event_stream(scrape_id):
+    """
+    SSE stream of scrape progress: the first event carries the current state,
+    later events only the fields that changed. The full result is sent once,
+    with the terminal status, and the stream then ends.
+    """
+    last_sent = {}
+    version = -1
+    while True:
+        with _SCRAPE_UPDATES:
+            scrape = active_scrapes.get(scrape_id)
+            if scrape is not None and scrape.get('version', 0) == version:
+                _SCRAPE_UPDATES.wait(timeout=SCRAPE_EVENTS_KEEPALIVE)
+                scrape = active_scrapes.get(scrape_id)
+            if scrape is None:
+                break
+            if scrape.get('version', 0) == version:
+                snapshot = None
+            else:
+                version = scrape.get('version', 0)
+                snapshot = {
+                    'status': scrape['status'],
+                    'progress': scrape['progress'],
+                    'progress_pct': scrape.get('progress_pct', 0),
+                    'phase': scrape.get('phase'),
+                    'error_code': scrape.get('error_code'),
+                    'error_message': scrape.get('error_message')
+                }
+
+        if snapshot is None:
+            yield b': keep-alive\n\n'
+            continue
+
+        delta = {k: v for k, v in snapshot.items() if last_sent.get(k, object()) != v}
+        last_sent.update(snapshot)
+        if snapshot['status'] in SCRAPE_TERMINAL_STATES:
+            delta['status'] = snapshot['status']
+            delta['result'] = scrape['result']
+            yield sse_event(delta)
+            return
+        if delta:
+            yield sse_event(delta)
+
+    # Not (or no longer) in memory - fall back to the persistent state once
+    job_status = state_manager.get_job_status(scrape_id)
+    if job_status:
+        yield sse_event(job_status)
+    else:
+        yield sse_event({'status': 'error', 'error_code': 'SCRAPE-NOT-FOUND',
+                         'error_message': 'Scrape not found'})
+
+
+@app.route('/api/scrape/<scrape_id>/events')
+def scrape_events(scrape_id):
+    """Server-Sent Events alternative to polling /api/scrape/<id>/status"""
+    return Response(
+        scrape_event_stream(scrape_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @app.route('/api/scrape/<scrape_id>/abort', methods=['POST'])
 def abort_scrape(scrape_id):
     """Abort a running scrape"""
-    if scrape_id in active_scrapes:
-        active_scrapes[scrape_id]['status'] = 'aborted'
+    with _SCRAPES_LOCK:
+        scrape = active_scrapes.get(scrape_id)
+    if scrape is not None:
+        scrape['status'] = 'aborted'
         state_manager.abort_job(scrape_id, "User cancelled")
+        _notify_scrape_update(scrape_id)
         logger.info("API", f"Scrape {scrape_id} aborted by user")
         return jsonify({'success': True, 'message': 'Scrape aborted'})
 
@@ -647,42 +1153,44 @@ def get_active_scrapes():
 @app.route('/api/history')
 def get_history():
     """Get scrape history"""
-    return jsonify(load_history())
+    return json_response(_get_history())
 
 
 @app.route('/api/history/<scrape_id>', methods=['DELETE'])
 def delete_history_item(scrape_id):
     """Delete a history item"""
-    history = load_history()
-    history = [h for h in history if h.get('id') != scrape_id]
-    save_history(history)
+    if not delete_scrape(scrape_id):
+        return jsonify({'error': 'Scrape not found'}), 404
     return jsonify({'success': True})
 
 
 @app.route('/api/history/clear', methods=['POST'])
 def clear_history():
     """Clear all history"""
-    save_history([])
+    clear_all_history()
     return jsonify({'success': True})
 
 
 @app.route('/api/download/video/<scrape_id>/<shortcode>')
 def download_video_file(scrape_id, shortcode):
     """Download a video file"""
-    history = load_history()
-    scrape = next((h for h in history if h.get('id') == scrape_id), None)
+    scrape, reel, _ = find_reel(scrape_id, shortcode)
 
     if not scrape:
         return jsonify({'error': 'Scrape not found'}), 404
 
-    reel = next((r for r in scrape.get('top_reels', []) if r.get('shortcode') == shortcode), None)
-
     if not reel:
         return jsonify({'error': 'Reel not found'}), 404
 
     video_path = reel.get('local_video')
-    if video_path and os.path.exists(video_path):
-        return send_file(video_path, as_attachment=True)
+    if video_path:
+        # send_file stats the path itself, so skip a separate exists() check.
+        # The body goes through wsgi.file_wrapper (sendfile under waitress/gunicorn);
+        # conditional=True adds Range and If-None-Match/304 handling.
+        try:
+            return send_file(video_path, as_attachment=True, conditional=True, etag=True)
+        except FileNotFoundError:
+            pass
 
     return jsonify({'error': 'Video file not found'}), 404
 
@@ -690,20 +1198,11 @@ def download_video_file(scrape_id, shortcode):
 @app.route('/api/fetch/video/<scrape_id>/<shortcode>', methods=['POST'])
 def fetch_video(scrape_id, shortcode):
     """Fetch/download a video on-demand"""
-    history = load_history()
-    scrape = next((h for h in history if h.get('id') == scrape_id), None)
+    scrape, reel, reel_idx = find_reel(scrape_id, shortcode)
 
     if not scrape:
         return jsonify({'error': 'Scrape not found'}), 404
 
-    reel_idx = None
-    reel = None
-    for i, r in enumerate(scrape.get('top_reels', [])):
-        if r.get('shortcode') == shortcode:
-            reel_idx = i
-            reel = r
-            break
-
     if not reel:
         return jsonify({'error': 'Reel not found'}), 404
 
@@ -718,12 +1217,13 @@ def fetch_video(scrape_id, shortcode):
     filepath = video_dir / filename
 
     session = create_session(str(COOKIES_FILE))
-    success = download_video(reel.get('url'), str(filepath), str(COOKIES_FILE), reel.get('video_url'))
+    success = download_video(reel.get('url'), str(filepath), str(COOKIES_FILE), reel.get('video_url'),
+                             session=session)
 
     if success:
         # Update history
         scrape['top_reels'][reel_idx]['local_video'] = str(filepath)
-        save_history(history)
+        save_scrape(scrape)
         return jsonify({'success': True, 'path': str(filepath)})
 
     return jsonify({'error': 'Download failed'}), 500
@@ -732,30 +1232,34 @@ def fetch_video(scrape_id, shortcode):
 @app.route('/api/download/transcript/<scrape_id>/<shortcode>')
 def download_transcript_file(scrape_id, shortcode):
     """Download a transcript file"""
-    history = load_history()
-    scrape = next((h for h in history if h.get('id') == scrape_id), None)
+    scrape, reel, _ = find_reel(scrape_id, shortcode)
 
     if not scrape:
         return jsonify({'error': 'Scrape not found'}), 404
 
-    reel = next((r for r in scrape.get('top_reels', []) if r.get('shortcode') == shortcode), None)
-
     if not reel:
         return jsonify({'error': 'Reel not found'}), 404
 
     # Try transcript file first
     transcript_path = reel.get('transcript_file')
-    if transcript_path and os.path.exists(transcript_path):
-        return send_file(transcript_path, as_attachment=True)
+    if transcript_path:
+        try:
+            return send_file(transcript_path, as_attachment=True, conditional=True, etag=True)
+        except FileNotFoundError:
+            pass
 
     # Generate from memory
     transcript = reel.get('transcript')
     if transcript:
-        return Response(
-            transcript,
+        body = transcript.encode('utf-8')
+        response = Response(
+            body,
             mimetype='text/plain',
-            headers={'Content-Disposition': f'attachment; filename={shortcode}.txt'}
+            headers={'Content-Disposition': f'attachment; filename={shortcode}.txt'},
+            direct_passthrough=True
         )
+        response.content_length = len(body)
+        return response
 
     return jsonify({'error': 'Transcript not found'}), 404
 
@@ -814,8 +1318,8 @@ def transcribe_video_on_demand():
     if transcript:
         # Try to update history with new transcript
         print(f"[TRANSCRIBE] Got transcript ({len(transcript)} chars), updating history for shortcode={shortcode}")
-        history = load_history()
-        updated = False
+        history = _get_history()
+        updated = None
         scrape_id_found = None
 
         for scrape in history:
@@ -824,7 +1328,7 @@ def transcribe_video_on_demand():
                 print(f"[TRANSCRIBE] Checking reel: sc={sc} vs shortcode={shortcode}")
                 if sc == shortcode:
                     reel['transcript'] = transcript
-                    updated = True
+                    updated = scrape
                     scrape_id_found = scrape.get('id')
                     print(f"[TRANSCRIBE] MATCH FOUND! Updated reel in scrape {scrape_id_found}")
                     break
@@ -832,7 +1336,7 @@ def transcribe_video_on_demand():
                 break
 
         if updated:
-            save_history(history)
+            save_scrape(updated)
             print(f"[TRANSCRIBE] History saved successfully for {shortcode} in scrape {scrape_id_found}")
         else:
             print(f"[TRANSCRIBE] WARNING: Could not find reel with shortcode={shortcode} in any scrape")
@@ -879,7 +1383,8 @@ def get_settings():
         'has_anthropic_key': bool(config.get('anthropic_key')),
         'has_google_key': bool(config.get('google_key')),
         'output_directory': config.get('output_directory', ''),
-        'default_output_directory': str(OUTPUT_DIR)
+        'default_output_directory': str(OUTPUT_DIR),
+        'prefetch_rewrites': bool(config.get('prefetch_rewrites'))
     })
 
 
@@ -906,6 +1411,8 @@ def update_settings():
         config['anthropic_key'] = data['anthropic_key']
     if 'google_key' in data and data['google_key']:
         config['google_key'] = data['google_key']
+    if 'prefetch_rewrites' in data:
+        config['prefetch_rewrites'] = bool(data['prefetch_rewrites'])
     if 'output_directory' in data:
         # Allow empty string to reset to default
         config['output_directory'] = data['output_directory'].strip()
@@ -963,6 +1470,21 @@ def get_ollama_models_endpoint():
     return jsonify({'models': models, 'available': len(models) > 0})
 
 
+# Installed-model checks are polled by the settings UI; re-stat at most this often
+WHISPER_CHECK_TTL = 10  # seconds
+_whisper_check_cache = {}  # model file -> (installed, expires)
+
+
+@lru_cache(maxsize=1)
+def _whisper_cache_dir():
+    """Whisper model cache directory (resolved once)"""
+    # In WSL, use Windows-level whisper cache
+    # Windows path: /mnt/c/Users/Chris/.cache/whisper/
+    windows_cache = Path('/mnt/c/Users/Chris/.cache/whisper')
+    linux_cache = Path.home() / '.cache' / 'whisper'
+    return windows_cache if windows_cache.exists() else linux_cache
+
+
 @app.route('/api/whisper/check/<model>')
 def check_whisper_model(model):
     """Check if a Whisper model is installed locally"""
@@ -973,6 +1495,15 @@ def check_whisper_model(model):
             'message': 'Whisper not installed'
         })
 
+    if FASTER_WHISPER_AVAILABLE:
+        # faster-whisper keeps its own model cache and fetches models on first load
+        return jsonify({
+            'installed': True,
+            'whisper_available': True,
+            'model': model,
+            'path': None
+        })
+
     # Model file names (Whisper uses .pt extension)
     model_files = {
         'tiny': 'tiny.pt',
@@ -990,18 +1521,17 @@ def check_whisper_model(model):
     }
 
     model_file = model_files.get(model, f"{model}.pt")
+    model_path = _whisper_cache_dir() / model_file
 
-    # In WSL, use Windows-level whisper cache
-    # Windows path: /mnt/c/Users/Chris/.cache/whisper/
-    windows_cache = Path('/mnt/c/Users/Chris/.cache/whisper')
-    linux_cache = Path.home() / '.cache' / 'whisper'
-    cache_dir = windows_cache if windows_cache.exists() else linux_cache
-
-    model_path = cache_dir / model_file
-    installed = model_path.exists()
-
-    # Debug: Log the path being checked
-    print(f"[Whisper Check] Model: {model}, Path: {model_path}, Exists: {installed}")
+    now = time.monotonic()
+    cached = _whisper_check_cache.get(model_file)
+    if cached and now < cached[1]:
+        installed = cached[0]
+    else:
+        installed = model_path.exists()
+        _whisper_check_cache[model_file] = (installed, now + WHISPER_CHECK_TTL)
+        # Debug: Log the path being checked
+        print(f"[Whisper Check] Model: {model}, Path: {model_path}, Exists: {installed}")
 
     return jsonify({
         'installed': installed,
@@ -1014,14 +1544,11 @@ def check_whisper_model(model):
 @app.route('/api/generate-prompt/<scrape_id>/<shortcode>')
 def generate_prompt(scrape_id, shortcode):
     """Generate AI rewrite prompt for a reel"""
-    history = load_history()
-    scrape = next((h for h in history if h.get('id') == scrape_id), None)
+    scrape, reel, _ = find_reel(scrape_id, shortcode)
 
     if not scrape:
         return jsonify({'error': 'Scrape not found'}), 404
 
-    reel = next((r for r in scrape.get('top_reels', []) if r.get('shortcode') == shortcode), None)
-
     if not reel:
         return jsonify({'error': 'Reel not found'}), 404
 
@@ -1029,6 +1556,49 @@ def generate_prompt(scrape_id, shortcode):
     return jsonify({'prompt': prompt})
 
 
+# Concurrent provider calls per /api/rewrite/batch request
+REWRITE_BATCH_WORKERS = 8
+
+
+def build_rewrite_prompt(reel, user_context=''):
+    """Return (base_prompt, full_prompt) for a reel, with optional user context appended"""
+    base_prompt = generate_ai_prompt(reel)
+    if user_context:
+        full_prompt = f"{base_prompt}\nMY CONTEXT (adapt script for this):\n{user_context}\n\nRemember: Output ONLY the script, no preamble."
+    else:
+        full_prompt = base_prompt
+    return base_prompt, full_prompt
+
+
+def resolve_rewrite_model(provider, override_model, config):
+    """Resolve (model, api_key, error) for a rewrite provider from the request and config"""
+    if provider == 'local':
+        model = override_model or config.get('local_model')
+        if not model:
+            return None, None, 'No local model selected'
+        return model, None, None
+
+    if provider == 'openai':
+        api_key = config.get('openai_key')
+        if not api_key:
+            return None, None, 'OpenAI API key not configured'
+        return override_model or config.get('openai_model', 'gpt-4o-mini'), api_key, None
+
+    if provider == 'anthropic':
+        api_key = config.get('anthropic_key')
+        if not api_key:
+            return None, None, 'Anthropic API key not configured'
+        return override_model or config.get('anthropic_model', 'claude-3-5-haiku-20241022'), api_key, None
+
+    if provider == 'google':
+        api_key = config.get('google_key')
+        if not api_key:
+            return None, None, 'Google API key not configured'
+        return override_model or config.get('google_model', 'gemini-1.5-flash'), api_key, None
+
+    return None, None, f'Unknown provider: {provider}'
+
+
 @app.route('/api/rewrite', methods=['POST'])
 def rewrite_script():
     """Generate AI rewrite using specified or default provider"""
@@ -1042,14 +1612,11 @@ def rewrite_script():
     if not scrape_id or not shortcode:
         return jsonify({'error': 'Missing scrape_id or shortcode'}), 400
 
-    history = load_history()
-    scrape = next((h for h in history if h.get('id') == scrape_id), None)
+    scrape, reel, _ = find_reel(scrape_id, shortcode)
 
     if not scrape:
         return jsonify({'error': 'Scrape not found'}), 404
 
-    reel = next((r for r in scrape.get('top_reels', []) if r.get('shortcode') == shortcode), None)
-
     if not reel:
         return jsonify({'error': 'Reel not found'}), 404
 
@@ -1062,167 +1629,442 @@ def rewrite_script():
         return jsonify({'error': 'AI provider not configured. Set provider in settings.'}), 400
 
     # Build prompt
-    base_prompt = generate_ai_prompt(reel)
-    if user_context:
-        full_prompt = f"{base_prompt}\nMY CONTEXT (adapt script for this):\n{user_context}\n\nRemember: Output ONLY the script, no preamble."
-    else:
-        full_prompt = base_prompt
+    base_prompt, full_prompt = build_rewrite_prompt(reel, user_context)
+
+    model, api_key, error = resolve_rewrite_model(provider, override_model, config)
+    if error:
+        return jsonify({'error': error}), 400
+
+    # 'refresh' skips the cache lookup so the user can ask for a fresh variant
+    # (the UI sends it when GENERATE is clicked again with the same inputs)
+    use_cache = not data.get('refresh')
+    semantic_parts = (base_prompt, user_context)
+
+    if provider == 'local' and data.get('stream'):
+        cached = rewrite_cache.get(provider, model, full_prompt, parts=semantic_parts,
+                                   scope=shortcode) if use_cache else None
+        if cached is not None:
+            return jsonify({'result': cached, 'provider': provider, 'model': model, 'cached': True})
+        # Stream tokens to the browser as Ollama produces them
+        return Response(
+            stream_ollama_events(full_prompt, model, semantic_parts, scope=shortcode),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
 
-    # Call appropriate provider
-    if provider == 'local':
-        model = override_model or config.get('local_model')
-        if not model:
-            return jsonify({'error': 'No local model selected'}), 400
-        result = call_ollama(full_prompt, model)
+    result, cached = cached_rewrite(provider, model, full_prompt, api_key,
+                                    semantic_parts=semantic_parts, use_cache=use_cache, scope=shortcode)
 
-    elif provider == 'openai':
-        api_key = config.get('openai_key')
-        if not api_key:
-            return jsonify({'error': 'OpenAI API key not configured'}), 400
-        model = override_model or config.get('openai_model', 'gpt-4o-mini')
-        result = call_openai(full_prompt, model, api_key)
+    return jsonify({'result': result, 'provider': provider, 'model': model, 'cached': cached})
 
-    elif provider == 'anthropic':
-        api_key = config.get('anthropic_key')
-        if not api_key:
-            return jsonify({'error': 'Anthropic API key not configured'}), 400
-        model = override_model or config.get('anthropic_model', 'claude-3-5-haiku-20241022')
-        result = call_anthropic(full_prompt, model, api_key)
 
-    elif provider == 'google':
-        api_key = config.get('google_key')
-        if not api_key:
-            return jsonify({'error': 'Google API key not configured'}), 400
-        model = override_model or config.get('google_model', 'gemini-1.5-flash')
-        result = call_google(full_prompt, model, api_key)
+@app.route('/api/rewrite/batch', methods=['POST'])
+def rewrite_batch():
+    """Generate AI rewrites for several reels of one scrape concurrently"""
+    data = request.json or {}
+    scrape_id = data.get('scrape_id')
+    shortcodes = data.get('shortcodes') or []
+    user_context = data.get('context', '')
 
-    else:
-        return jsonify({'error': f'Unknown provider: {provider}'}), 400
+    if not scrape_id or not shortcodes:
+        return jsonify({'error': 'Missing scrape_id or shortcodes'}), 400
 
-    return jsonify({'result': result, 'provider': provider, 'model': model})
+    scrape = load_scrape(scrape_id)
+    if not scrape:
+        return jsonify({'error': 'Scrape not found'}), 404
+
+    config = load_config()
+    provider = data.get('provider') or config.get('ai_provider', 'copy')
+    if provider == 'copy':
+        return jsonify({'error': 'AI provider not configured. Set provider in settings.'}), 400
+
+    model, api_key, error = resolve_rewrite_model(provider, data.get('model'), config)
+    if error:
+        return jsonify({'error': error}), 400
+
+    use_cache = not data.get('refresh')
+    reels_by_code = {r.get('shortcode'): r for r in scrape.get('top_reels', [])}
+
+    def rewrite_one(reel):
+        base_prompt, full_prompt = build_rewrite_prompt(reel, user_context)
+        return cached_rewrite(provider, model, full_prompt, api_key,
+                              semantic_parts=(base_prompt, user_context), use_cache=use_cache,
+                              scope=reel.get('shortcode') or '')
+
+    results = []
+    futures = {}
+    with ThreadPoolExecutor(max_workers=REWRITE_BATCH_WORKERS, thread_name_prefix='rewrite') as pool:
+        for shortcode in shortcodes:
+            reel = reels_by_code.get(shortcode)
+            if reel is None:
+                results.append({'shortcode': shortcode, 'error': 'Reel not found'})
+            else:
+                futures[shortcode] = pool.submit(rewrite_one, reel)
+        wait(futures.values())
+
+    for shortcode, future in futures.items():
+        try:
+            result, cached = future.result()
+            results.append({'shortcode': shortcode, 'result': result, 'cached': cached})
+        except Exception as e:
+            results.append({'shortcode': shortcode, 'error': str(e)})
+
+    order = {code: i for i, code in enumerate(shortcodes)}
+    results.sort(key=lambda item: order.get(item['shortcode'], 0))
+
+    logger.info("API", f"Batch rewrite: {len(futures)} reels via {provider}/{model}")
+    return jsonify({'results': results, 'provider': provider, 'model': model})
 
 
 # =====================
 # VIDEO GALLERY ENDPOINTS
 # =====================
 
+_TRANSCRIPT_CACHE = {'version': None, 'map': {}}
+
+
+def get_transcript_map():
+    """
+    shortcode/video_id -> (transcript, caption, scrape_id, reel_url) for every
+    transcribed reel in history. Rebuilt only when history has changed.
+    """
+    with _history_lock:
+        if _TRANSCRIPT_CACHE['version'] == _history_version:
+            return _TRANSCRIPT_CACHE['map']
+
+        # Oldest first so the newest scrape's copy of a reel wins
+        transcript_map = {
+            reel.get('shortcode') or reel.get('video_id'):
+                (reel['transcript'], reel.get('caption', ''), scrape.get('id'), reel.get('url', ''))
+            for scrape in reversed(load_history())
+            for reel in scrape.get('top_reels', ())
+            if reel.get('transcript') and (reel.get('shortcode') or reel.get('video_id'))
+        }
+        _TRANSCRIPT_CACHE['version'] = _history_version
+        _TRANSCRIPT_CACHE['map'] = transcript_map
+        return transcript_map
+
+
+_LOCAL_VIDEO_INDEX = {'version': None, 'map': {}}
+
+
+def get_local_video_index():
+    """
+    local_video path -> [(scrape_id, reel_idx), ...] for every downloaded reel
+    in history. Rebuilt only when history has changed.
+    """
+    with _history_lock:
+        if _LOCAL_VIDEO_INDEX['version'] == _history_version:
+            return _LOCAL_VIDEO_INDEX['map']
+
+        index = {}
+        for scrape in load_history():
+            for idx, reel in enumerate(scrape.get('top_reels', [])):
+                local_video = reel.get('local_video')
+                if local_video:
+                    index.setdefault(local_video, []).append((scrape.get('id'), idx))
+        _LOCAL_VIDEO_INDEX['version'] = _history_version
+        _LOCAL_VIDEO_INDEX['map'] = index
+        return index
+
+
+# Extensions listed by the video gallery (lowercase, no dot)
+VIDEO_EXTENSIONS = frozenset(('mp4', 'mov', 'webm'))
+VIDEO_MIMETYPES = {'.mp4': 'video/mp4', '.mov': 'video/quicktime', '.webm': 'video/webm'}
+# Anything but letters, digits, '.', '_' and '-' is stripped from streamed path parts
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w.-]')
+VIDEO_STREAM_MAX_AGE = 3600  # seconds; revalidated via ETag afterwards
+
+
+_NO_TRANSCRIPT = (None, '', None, '')
+
+
+class VideoRecord:
+    """
+    One video found by the gallery scan. Slotted so large libraries don't
+    allocate a 13-key dict per file; the response dict is only built (by
+    to_dict) for the entries that make the limit.
+    """
+    __slots__ = ('created', 'size', 'path', 'filename', 'stem', 'shortcode', 'username', 'platform')
+
+    def __init__(self, created, size, path, filename, stem, shortcode, username, platform):
+        self.created = created
+        self.size = size
+        self.path = path
+        self.filename = filename
+        self.stem = stem
+        self.shortcode = shortcode
+        self.username = username
+        self.platform = platform
+
+    @staticmethod
+    def parse_shortcode(stem):
+        """Shortcode from a {rank}_{views}views_{shortcode} stem (whole stem otherwise)"""
+        head, _, tail = stem.rpartition('_')
+        return tail if '_' in head else stem
+
+    def to_dict(self, transcript_map):
+        # Parse filename to extract info
+        # Format: {rank}_{views}views_{shortcode}.mp4
+        shortcode = self.shortcode
+        views = 0
+        views_part = self.stem.partition('_')[2].partition('_')[0]
+        if views_part:
+            if views_part.endswith('views'):
+                views_part = views_part[:-5]
+            try:
+                views = int(views_part)
+            except ValueError:
+                pass
+
+        # Get transcript data if available
+        transcript, caption, scrape_id, reel_url = transcript_map.get(shortcode, _NO_TRANSCRIPT)
+
+        return {
+            'filename': self.filename,
+            'path': self.path,
+            'username': self.username,
+            'shortcode': shortcode,
+            'views': views,
+            'size': self.size,
+            'created': self.created,
+            'url': f'/api/videos/stream/{self.username}/{self.filename}',
+            'transcript': transcript,
+            'caption': caption,
+            'scrape_id': scrape_id,
+            'reel_url': reel_url,
+            'platform': self.platform
+        }
+
+
+def _iter_user_dirs(output_dir, filter_username=''):
+    """
+    Yield (username, path) for each creator folder in an output directory,
+    handling both IG (output_user) and TikTok (output_user_tiktok) names.
+    With a username filter the creator's folders are looked up directly, so
+    the (possibly large) output directory is only listed when the filter's
+    spelling doesn't match a folder exactly. Matching ignores case.
+    """
+    if filter_username:
+        # Folder names never contain separators; don't let the filter walk out of output_dir
+        if '/' in filter_username or '\\' in filter_username:
+            return
+        found = False
+        for dirname in (f'output_{filter_username}', f'output_{filter_username}_tiktok'):
+            path = os.path.join(output_dir, dirname)
+            try:
+                if stat.S_ISDIR(os.lstat(path).st_mode):
+                    found = True
+                    yield filter_username, path
+            except OSError:
+                pass
+        if found:
+            return
+
+    wanted = filter_username.lower()
+    with os.scandir(output_dir) as user_dirs:
+        for user_dir in user_dirs:
+            if not (user_dir.name.startswith('output_') and user_dir.is_dir(follow_symlinks=False)):
+                continue
+
+            # Extract username
+            username = user_dir.name.replace('output_', '')
+            if username.endswith('_tiktok'):
+                username = username[:-7]  # Remove '_tiktok' suffix
+            if wanted and username.lower() != wanted:
+                continue
+            yield username, user_dir.path
+
+
+def _scan_video_dirs(output_dirs, filter_username=''):
+    """Walk (output_dir, platform) roots and return a VideoRecord per video file"""
+    records = []
+    # Resolved videos/ dirs already listed - roots can overlap (a custom output
+    # directory set to the default, or IG and TikTok sharing one), and a file
+    # must not be listed twice. Distinct copies of a reel are all listed.
+    seen_dirs = set()
+
+    for output_dir, platform in output_dirs:
+        if not output_dir.exists():
+            continue
+
+        for username, user_dir in _iter_user_dirs(output_dir, filter_username):
+            video_dir = os.path.join(user_dir, 'videos')
+            real_dir = os.path.realpath(video_dir)
+            if real_dir in seen_dirs:
+                continue
+            seen_dirs.add(real_dir)
+            try:
+                video_entries = os.scandir(video_dir)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            with video_entries:
+                for video_file in video_entries:
+                    stem, _, ext = video_file.name.rpartition('.')
+                    if not stem or ext.lower() not in VIDEO_EXTENSIONS:
+                        continue
+
+                    # One stat per file, reused for size and mtime
+                    st = video_file.stat()
+                    records.append(VideoRecord(st.st_mtime, st.st_size, video_file.path, video_file.name,
+                                               stem, VideoRecord.parse_shortcode(stem), username, platform))
+    return records
+
+
+# Full-library scans run off the request thread. The last result is kept as a
+# snapshot and served while a refresh runs; a change in any output root's or
+# creator videos/ dir's mtime marks it stale.
+_VIDEO_SCAN_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='video-scan')
+_VIDEO_SCAN_LOCK = threading.Lock()
+_video_snapshot = {'roots': None, 'stamp': None, 'records': None, 'future': None, 'generation': 0}
+
+
+def _video_scan_stamp(output_dirs):
+    """Directory mtimes that change whenever a video or creator folder is added/removed"""
+    stamp = []
+    for output_dir, _ in output_dirs:
+        try:
+            stamp.append(os.stat(output_dir).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+            continue
+        for _, user_dir in _iter_user_dirs(output_dir):
+            try:
+                stamp.append(os.stat(os.path.join(user_dir, 'videos')).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+    return tuple(stamp)
+
+
+def _refresh_video_snapshot(output_dirs, generation):
+    # Stamp first, so changes made during the walk leave the snapshot stale
+    stamp = _video_scan_stamp(output_dirs)
+    records = _scan_video_dirs(output_dirs)
+    with _VIDEO_SCAN_LOCK:
+        _video_snapshot['future'] = None
+        if _video_snapshot['roots'] == output_dirs and _video_snapshot['generation'] == generation:
+            _video_snapshot['stamp'] = stamp
+            _video_snapshot['records'] = records
+    return records
+
+
+def get_video_snapshot(output_dirs):
+    """
+    VideoRecords for every video under output_dirs. Fresh snapshots are returned
+    as-is; stale ones are returned immediately while a background rescan runs.
+    Only the very first scan (or one after invalidate_video_snapshot) is waited on.
+    """
+    stamp = _video_scan_stamp(output_dirs)
+    with _VIDEO_SCAN_LOCK:
+        if _video_snapshot['roots'] != output_dirs:
+            # Output directory changed in settings - old rows are meaningless
+            _video_snapshot.update(roots=output_dirs, stamp=None, records=None)
+            _video_snapshot['generation'] += 1
+
+        records = _video_snapshot['records']
+        if records is not None and _video_snapshot['stamp'] == stamp:
+            return records
+
+        future = _video_snapshot['future']
+        if future is None:
+            future = _VIDEO_SCAN_POOL.submit(
+                _refresh_video_snapshot, output_dirs, _video_snapshot['generation'])
+            _video_snapshot['future'] = future
+
+    if records is not None:
+        return records
+    return future.result()
+
+
+def invalidate_video_snapshot():
+    """Drop the snapshot after our own deletes so removed videos never reappear"""
+    with _VIDEO_SCAN_LOCK:
+        _video_snapshot.update(stamp=None, records=None)
+        _video_snapshot['generation'] += 1
+
+
 @app.route('/api/videos')
 def list_videos():
-    """List downloaded videos, optionally filtered by username or platform"""
-    videos = []
-    seen_paths = set()  # Track seen paths to avoid duplicates
+    """
+    List downloaded videos, newest first, optionally filtered by username or
+    platform. `limit` caps the number returned (default 0 = all); `total` is
+    the number of matching videos before the cap.
+    """
     filter_username = request.args.get('username', '').strip()
     filter_platform = request.args.get('platform', '').strip().lower()
+    try:
+        limit = int(request.args.get('limit', 0))
+    except ValueError:
+        return json_response({'error': 'limit must be an integer'}, status=400)
 
     # Scan all output directories (IG and TikTok)
+    ig_output_dir = _get_output_directory('instagram')
+    tt_output_dir = _get_output_directory('tiktok')
     output_dirs_to_scan = [
-        (get_output_directory('instagram'), 'instagram'),
-        (get_output_directory('tiktok'), 'tiktok'),
+        (ig_output_dir, 'instagram'),
+        (tt_output_dir, 'tiktok'),
     ]
     # Also check defaults if different
-    if get_output_directory('instagram') != OUTPUT_DIR and OUTPUT_DIR.exists():
+    if ig_output_dir != OUTPUT_DIR and OUTPUT_DIR.exists():
         output_dirs_to_scan.append((OUTPUT_DIR, 'instagram'))
-    if get_output_directory('tiktok') != TIKTOK_OUTPUT_DIR and TIKTOK_OUTPUT_DIR.exists():
+    if tt_output_dir != TIKTOK_OUTPUT_DIR and TIKTOK_OUTPUT_DIR.exists():
         output_dirs_to_scan.append((TIKTOK_OUTPUT_DIR, 'tiktok'))
 
-    # Build a lookup map of shortcode/video_id -> transcript from history
-    transcript_map = {}
-    history = load_history()
-    for scrape in history:
-        platform = scrape.get('platform', 'instagram')
-        for reel in scrape.get('top_reels', []):
-            sc = reel.get('shortcode') or reel.get('video_id')
-            if sc and reel.get('transcript'):
-                transcript_map[sc] = {
-                    'transcript': reel.get('transcript'),
-                    'caption': reel.get('caption', ''),
-                    'scrape_id': scrape.get('id'),
-                    'reel_url': reel.get('url', ''),
-                    'platform': platform
-                }
+    transcript_map = get_transcript_map()
 
-    # Scan all output directories for videos
-    for output_dir, platform in output_dirs_to_scan:
-        if not output_dir.exists():
-            continue
-
-        # Skip if filtering by platform and this isn't a match
-        if filter_platform and platform != filter_platform:
-            continue
-
-        for user_dir in output_dir.iterdir():
-            if user_dir.is_dir() and user_dir.name.startswith('output_'):
-                # Extract username, handling both IG (output_user) and TikTok (output_user_tiktok)
-                username = user_dir.name.replace('output_', '')
-                if username.endswith('_tiktok'):
-                    username = username[:-7]  # Remove '_tiktok' suffix
+    if filter_username:
+        # One creator's folders - cheap enough to scan directly
+        records = _scan_video_dirs(
+            [(d, p) for d, p in output_dirs_to_scan if not filter_platform or p == filter_platform],
+            filter_username
+        )
+    else:
+        records = get_video_snapshot(tuple(output_dirs_to_scan))
+        if filter_platform:
+            records = [r for r in records if r.platform == filter_platform]
 
-                # Skip if filtering by username and this isn't a match
-                if filter_username and username.lower() != filter_username.lower():
-                    continue
+    total = len(records)
 
-                video_dir = user_dir / 'videos'
-                if video_dir.exists():
-                    for video_file in video_dir.iterdir():
-                        # Skip if we've already seen this file
-                        if str(video_file) in seen_paths:
-                            continue
-                        seen_paths.add(str(video_file))
-
-                        if video_file.suffix.lower() in ['.mp4', '.mov', '.webm']:
-                            # Parse filename to extract info
-                            # Format: {rank}_{views}views_{shortcode}.mp4
-                            parts = video_file.stem.split('_')
-                            shortcode = parts[-1] if len(parts) >= 3 else video_file.stem
-                            views = 0
-                            if len(parts) >= 2:
-                                views_part = parts[1].replace('views', '')
-                                try:
-                                    views = int(views_part)
-                                except:
-                                    pass
-
-                            # Get transcript data if available
-                            transcript_data = transcript_map.get(shortcode, {})
-
-                            videos.append({
-                                'filename': video_file.name,
-                                'path': str(video_file),
-                                'username': username,
-                                'shortcode': shortcode,
-                                'views': views,
-                                'size': video_file.stat().st_size,
-                                'created': video_file.stat().st_mtime,
-                                'url': f'/api/videos/stream/{username}/{video_file.name}',
-                                'transcript': transcript_data.get('transcript'),
-                                'caption': transcript_data.get('caption', ''),
-                                'scrape_id': transcript_data.get('scrape_id'),
-                                'reel_url': transcript_data.get('reel_url', ''),
-                                'platform': platform
-                            })
-
-    # Sort by creation time (newest first)
-    videos.sort(key=lambda x: x['created'], reverse=True)
+    # Newest first; bounded heap when a limit applies
+    if limit > 0:
+        records = heapq.nlargest(limit, records, key=attrgetter('created'))
+    else:
+        # Snapshot lists are shared between requests - never sort in place
+        records = sorted(records, key=attrgetter('created'), reverse=True)
 
-    return jsonify({
-        'videos': videos,
+    meta = json_dumps({
+        'total': total,
         'filtered': bool(filter_username or filter_platform),
         'filter_username': filter_username if filter_username else None,
         'filter_platform': filter_platform if filter_platform else None
     })
 
+    def generate():
+        # Same document as before ({"videos": [...], "filtered": ...}), serialized
+        # one entry at a time so the full body is never buffered
+        yield b'{"videos":['
+        for i, record in enumerate(records):
+            video = json_dumps(record.to_dict(transcript_map))
+            yield video if i == 0 else b',' + video
+        yield b'],' + meta[1:]
+
+    return Response(generate(), mimetype='application/json')
+
 
 @app.route('/api/videos/stream/<username>/<filename>')
 def stream_video(username, filename):
     """Stream a video file"""
     # Security: Validate path to prevent traversal
-    safe_username = ''.join(c for c in username if c.isalnum() or c in '._-')
-    safe_filename = ''.join(c for c in filename if c.isalnum() or c in '._-')
+    safe_username = _UNSAFE_NAME_CHARS.sub('', username)
+    safe_filename = _UNSAFE_NAME_CHARS.sub('', filename)
+
+    root_prefixes = _output_root_prefixes()
 
     # Try all output directories (IG and TikTok)
     output_dirs_to_try = [
-        get_output_directory('instagram'),
-        get_output_directory('tiktok'),
+        _get_output_directory('instagram'),
+        _get_output_directory('tiktok'),
         OUTPUT_DIR,
         TIKTOK_OUTPUT_DIR
     ]
@@ -1238,20 +2080,34 @@ def stream_video(username, filename):
         ]
 
         for video_path in paths_to_try:
+            # lstat before resolve(): a symlink could point outside the output dirs,
+            # and a missing file costs one syscall instead of a full resolve
+            try:
+                st = os.lstat(video_path)
+            except OSError:
+                continue
+            if stat.S_ISLNK(st.st_mode):
+                return json_response({'error': 'Symlinked videos are not served'}, status=403)
+
             try:
                 video_path = video_path.resolve()
-                # Verify the file is within a valid output directory
-                if not (str(video_path).startswith(str(output_dir.resolve())) or
-                        str(video_path).startswith(str(OUTPUT_DIR.resolve())) or
-                        str(video_path).startswith(str(TIKTOK_OUTPUT_DIR.resolve()))):
-                    continue
-            except:
+            except (OSError, RuntimeError):
+                continue
+            # Verify the file is within a valid output directory
+            if not str(video_path).startswith(root_prefixes):
                 continue
 
-            if video_path.exists():
-                return send_file(video_path, mimetype='video/mp4')
+            if stat.S_ISREG(st.st_mode):
+                # conditional=True answers Range requests (seeking) with 206 partial
+                # content; the WSGI server's file_wrapper/sendfile does the copy
+                mimetype = VIDEO_MIMETYPES.get(video_path.suffix.lower(), 'video/mp4')
+                try:
+                    return send_file(video_path, mimetype=mimetype, conditional=True,
+                                     etag=True, max_age=VIDEO_STREAM_MAX_AGE)
+                except FileNotFoundError:
+                    continue
 
-    return jsonify({'error': 'Video not found'}), 404
+    return json_response({'error': 'Video not found'}, status=404)
 
 
 @app.route('/api/videos/delete', methods=['POST'])
@@ -1265,53 +2121,37 @@ def delete_video():
 
     video_path = Path(video_path)
 
+    # Security: refuse symlinks outright - resolve() would follow them and validate
+    # the target rather than the link the caller asked to delete
+    try:
+        st = os.lstat(video_path)
+    except OSError:
+        st = None
+    if st is not None and stat.S_ISLNK(st.st_mode):
+        return jsonify({'error': 'Invalid path - symlinks are not allowed'}), 403
+
     # Security: Verify the file is within a valid output directory (configured or default)
     try:
         video_path = video_path.resolve()
-        allowed_dirs = [
-            get_output_directory('instagram').resolve(),
-            get_output_directory('tiktok').resolve(),
-            OUTPUT_DIR.resolve(),
-            TIKTOK_OUTPUT_DIR.resolve()
-        ]
-
-        # Check if video path is within allowed directories using parent chain
-        is_valid = False
-        for parent in video_path.parents:
-            for allowed_dir in allowed_dirs:
-                if parent == allowed_dir:
-                    is_valid = True
-                    break
-                try:
-                    parent.relative_to(allowed_dir)
-                    is_valid = True
-                    break
-                except ValueError:
-                    pass
-            if is_valid:
-                break
-
-        if not is_valid:
+        if not str(video_path).startswith(_output_root_prefixes()):
             return jsonify({'error': 'Invalid path - outside allowed directory'}), 403
     except Exception as e:
         return jsonify({'error': f'Invalid path: {str(e)}'}), 403
 
-    if not video_path.exists():
+    if st is None:
         return jsonify({'error': 'File not found'}), 404
 
     # Delete the file
     try:
         video_path.unlink()
+        invalidate_video_snapshot()
 
         # Also update history to remove the local_video reference
-        history = load_history()
-        shortcode = video_path.stem.split('_')[-1]
-        for scrape in history:
-            for reel in scrape.get('top_reels', []):
-                if reel.get('local_video') == str(video_path):
-                    reel['local_video'] = None
-                    break
-        save_history(history)
+        for scrape_id, idx in get_local_video_index().get(str(video_path), ()):
+            scrape = load_scrape(scrape_id)
+            if scrape is not None:
+                scrape['top_reels'][idx]['local_video'] = None
+                save_scrape(scrape)
 
         return jsonify({'success': True})
     except Exception as e:
@@ -1588,13 +2428,15 @@ def skeleton_ripper_history():
     if not reports_dir.exists():
         return jsonify({'success': True, 'history': []})
 
-    # Get all report directories, sorted by newest first
-    report_dirs = sorted(reports_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True)
-
-    for report_dir in report_dirs[:20]:  # Limit to 20 most recent
-        if not report_dir.is_dir():
-            continue
+    # 20 most recent report directories, newest first. DirEntry answers is_dir()
+    # from the directory listing and caches its stat, so each entry costs one syscall
+    with os.scandir(reports_dir) as entries:
+        report_entries = heapq.nlargest(
+            20, (e for e in entries if e.is_dir()), key=lambda e: e.stat().st_mtime
+        )
 
+    for entry in report_entries:
+        report_dir = Path(entry.path)
         report_path = report_dir / 'report.md'
         skeletons_path = report_dir / 'skeletons.json'
 
@@ -2029,20 +2871,18 @@ def get_asset_content(asset_id):
         })
 
     elif asset_type == 'scrape_report':
-        # Scrape: find matching entry in scrape_history.json
+        # Scrape: find matching entry in scrape history
         original_id = metadata.get('original_id')
         username = metadata.get('username')
 
-        history = load_history()
-
         # Find matching scrape entry
         scrape_data = None
         if original_id:
-            scrape_data = next((h for h in history if h.get('id') == original_id), None)
+            scrape_data = load_scrape(original_id)
 
         if not scrape_data and username:
             # Fallback: find by username
-            scrape_data = next((h for h in history if h.get('username') == username), None)
+            scrape_data = next((h for h in _get_history() if h.get('username') == username), None)
 
         if not scrape_data:
             return jsonify({
@@ -2180,6 +3020,26 @@ def delete_collection(collection_id):
     return jsonify({'success': True})
 
 
+def run_server(host='127.0.0.1', port=5000, debug=False):
+    """
+    Serve the app with waitress (multi-threaded WSGI server, no fork - works on
+    Windows/Mac/Linux) when installed, otherwise Flask's threaded dev server.
+    LLM calls and scrapes are I/O-bound, so threads are the right unit here.
+    """
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.info("SYSTEM", "waitress not installed - using Flask development server")
+        # IMPORTANT: use_reloader=False prevents Flask from restarting when Whisper
+        # or other libraries touch their own files during import/execution.
+        # The watchdog was incorrectly detecting whisper/transcribe.py access as a change.
+        app.run(host=host, port=port, debug=debug, threaded=True, use_reloader=False)
+        return
+
+    logger.info("SYSTEM", f"Serving with waitress on {host}:{port}")
+    serve(app, host=host, port=port, threads=16, connection_limit=1000)
+
+
 if __name__ == '__main__':
     OUTPUT_DIR.mkdir(exist_ok=True)
     TIKTOK_OUTPUT_DIR.mkdir(exist_ok=True)
@@ -2188,7 +3048,4 @@ if __name__ == '__main__':
     init_db()
     logger.info("SYSTEM", "Asset database initialized")
 
-    # IMPORTANT: use_reloader=False prevents Flask from restarting when Whisper
-    # or other libraries touch their own files during import/execution.
-    # The watchdog was incorrectly detecting whisper/transcribe.py access as a change.
-    app.run(debug=True, port=5000, use_reloader=False)
+    run_server(port=5000, debug=True)
@@ -3,21 +3,32 @@ ReelRecon - Core Scraping Module
 Instagram reel extraction and transcription with robust error handling
 """
 
-import json
+import io
 import os
 import re
 import time
+import heapq
+import threading
+import shutil
 import hashlib
+import uuid
+import tempfile
+import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from functools import wraps
+from functools import wraps, lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import utilities from parent directory
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils import get_logger, retry_with_backoff, RetryConfig
+from utils import get_logger, retry_with_backoff, RetryConfig, json_dumps, json_loads
+from utils.rate_limiter import AdaptiveRateLimiter
 
 # Initialize logger
 logger = get_logger()
@@ -44,26 +55,87 @@ NETWORK_RETRY_CONFIG = RetryConfig(
     )
 )
 
-# Optional: Whisper for transcription
+# Shared pacing for Instagram API calls (scrapes can run concurrently). Starts
+# at the old one-request-per-second cadence and adapts from there.
+INSTAGRAM_RATE_LIMITER = AdaptiveRateLimiter(rate=1.0, burst=2, max_rate=2.0, name="SCRAPE")
+RATE_LIMIT_RETRIES = 2  # extra attempts after an HTTP 429 before giving up
+
+
+def instagram_request(session, method, url, **kwargs):
+    """session.request() paced by INSTAGRAM_RATE_LIMITER, retrying HTTP 429 with backoff"""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        INSTAGRAM_RATE_LIMITER.acquire()
+        resp = session.request(method, url, **kwargs)
+        if resp.status_code != 429:
+            INSTAGRAM_RATE_LIMITER.succeeded()
+            return resp
+        INSTAGRAM_RATE_LIMITER.throttled(resp.headers.get('Retry-After'))
+    return resp
+
+
+# Optional: Whisper for transcription. Only probe for the package here -
+# importing whisper pulls in torch, so load_whisper_model() imports it on demand
 try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
+    WHISPER_AVAILABLE = importlib.util.find_spec('whisper') is not None
+except (ImportError, ValueError):
     WHISPER_AVAILABLE = False
 
+# Optional: faster-whisper (CTranslate2, int8 on CPU) is used instead when
+# installed - same models, several times faster. It downloads its own
+# converted models from the Hugging Face hub rather than the .pt files
+try:
+    FASTER_WHISPER_AVAILABLE = importlib.util.find_spec('faster_whisper') is not None
+except (ImportError, ValueError):
+    FASTER_WHISPER_AVAILABLE = False
+WHISPER_AVAILABLE = WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE
+FASTER_WHISPER_COMPUTE_TYPE = 'int8'
+
+# Optional: yt-dlp as a module, so the download fallback runs in-process.
+# Without it download_video() shells out to the yt-dlp CLI instead
+try:
+    YT_DLP_AVAILABLE = importlib.util.find_spec('yt_dlp') is not None
+except (ImportError, ValueError):
+    YT_DLP_AVAILABLE = False
+
+# Loaded Whisper models, kept for the life of the process so back-to-back
+# scrapes don't reload ~500 MB of weights each time
+_whisper_models = {}  # (model_name, device) -> model
+_whisper_models_lock = threading.Lock()
+# whisper's decoder installs kv-cache hooks on the model for each call, so
+# two transcriptions must not run on one model at the same time
+_whisper_transcribe_lock = threading.Lock()
 
-def load_cookies(filepath):
-    """Load cookies from Netscape cookies.txt format"""
+
+HTTPONLY_PREFIX = '#HttpOnly_'
+
+
+@lru_cache(maxsize=8)
+def _parse_cookies_file(filepath, mtime_ns, size):
+    """Parse a Netscape cookies.txt. mtime_ns/size only key the cache."""
     cookies = {}
+    with open(filepath, 'r') as f:
+        text = f.read()
+    for line in text.splitlines():
+        # HttpOnly cookies (sessionid among them) are exported with this
+        # prefix - they are entries, not comments
+        if line.startswith(HTTPONLY_PREFIX):
+            line = line[len(HTTPONLY_PREFIX):]
+        elif not line or line[0] == '#':
+            continue
+        parts = line.split('\t')
+        if len(parts) >= 7:
+            cookies[parts[5]] = parts[6].strip()
+    return cookies
+
+
+def load_cookies(filepath):
+    """
+    Load cookies from Netscape cookies.txt format.
+    Parsed files are cached until their mtime or size changes.
+    """
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                parts = line.strip().split('\t')
-                if len(parts) >= 7:
-                    name, value = parts[5], parts[6]
-                    cookies[name] = value
+        st = os.stat(filepath)
+        cookies = dict(_parse_cookies_file(os.fspath(filepath), st.st_mtime_ns, st.st_size))
         logger.debug("COOKIES", f"Loaded {len(cookies)} cookies from {filepath}")
     except FileNotFoundError:
         logger.error("COOKIES", f"Cookies file not found: {filepath}")
@@ -74,8 +146,34 @@ def load_cookies(filepath):
     return cookies
 
 
+# Authenticated sessions, reused (keep-alive connections included) by later
+# scrapes and UI downloads until the cookies file changes
+_sessions = {}  # cookies_path -> ((mtime_ns, size), session)
+_sessions_lock = threading.Lock()
+
+
 def create_session(cookies_path):
-    """Create an authenticated Instagram session"""
+    """
+    Authenticated Instagram session for a cookies file.
+    The same session is returned until the file's mtime or size changes.
+    """
+    try:
+        st = os.stat(cookies_path)
+    except OSError:
+        return _new_session(cookies_path)  # raises with the usual cookie error
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.fspath(cookies_path)
+
+    with _sessions_lock:
+        cached = _sessions.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        session = _new_session(cookies_path)
+        _sessions[key] = (stamp, session)
+    return session
+
+
+def _new_session(cookies_path):
     logger.debug("SESSION", f"Creating authenticated session from {cookies_path}")
 
     try:
@@ -85,6 +183,18 @@ def create_session(cookies_path):
         raise RuntimeError(f"[{error_code}] Cookie loading failed: {e}")
 
     session = requests.Session()
+    # One keep-alive pool for every call of a scrape (and concurrent skeleton
+    # fetches and video downloads - CDN hosts vary, hence the wider host cache).
+    # Transient 5xx/connection failures are retried here; 429s are left to
+    # instagram_request() so the shared rate limiter sees them.
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=None, raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'X-IG-App-ID': '936619743392459',
@@ -109,59 +219,132 @@ def create_session(cookies_path):
     return session
 
 
+# Reel page fallback scrapers. Byte patterns match resp.content directly, so
+# the (large) HTML is never decoded as a whole
+_PLAY_COUNT_RE = re.compile(rb'"play_count":\s*(\d+)')
+_VIEW_COUNT_RE = re.compile(rb'"video_view_count":\s*(\d+)')
+_LIKE_COUNT_RE = re.compile(rb'"like_count":\s*(\d+)')
+# Up to 4 bytes per character, trimmed to 200 characters after decoding
+_CAPTION_RE = re.compile(rb'"text":\s*"([^"]{0,800})')
+REEL_PAGE_CHUNK_SIZE = 64 * 1024
+REEL_PAGE_OVERLAP = 1024  # bytes re-scanned across a chunk boundary (longest match)
+
+
+def _scrape_reel_html(session, shortcode):
+    """
+    Last-resort reel details from the public page. The page is streamed and
+    reading stops as soon as every field has been found.
+    """
+    url = f"https://www.instagram.com/reel/{shortcode}/"
+    resp = instagram_request(session, 'GET', url, stream=True)
+    html = bytearray()
+    patterns = {'views': _PLAY_COUNT_RE, 'likes': _LIKE_COUNT_RE, 'caption': _CAPTION_RE}
+    found = {}  # field -> matched group bytes
+    # Where each pattern's next search starts, so every byte is scanned about once
+    resume = dict.fromkeys(patterns, 0)
+
+    try:
+        for chunk in resp.iter_content(chunk_size=REEL_PAGE_CHUNK_SIZE):
+            html += chunk
+            for field, pattern in patterns.items():
+                if field in found:
+                    continue
+                match = pattern.search(html, resume[field])
+                if match and match.end() < len(html):
+                    found[field] = bytes(match.group(1))
+                elif match:
+                    # Runs into the end of the buffer - may be cut off mid-chunk
+                    resume[field] = match.start()
+                else:
+                    resume[field] = max(0, len(html) - REEL_PAGE_OVERLAP)
+            if len(found) == len(patterns):
+                break
+        else:
+            # Whole page read: accept whatever matched at the very end, and
+            # settle for the older view counter
+            for field, pattern in patterns.items():
+                match = field not in found and pattern.search(html, resume[field])
+                if match:
+                    found[field] = bytes(match.group(1))
+            if 'views' not in found:
+                match = _VIEW_COUNT_RE.search(html)
+                if match:
+                    found['views'] = bytes(match.group(1))
+    finally:
+        resp.close()
+
+    return {
+        'shortcode': shortcode,
+        'url': url,
+        'views': int(found['views']) if 'views' in found else 0,
+        'likes': int(found['likes']) if 'likes' in found else 0,
+        'caption': found['caption'].decode('utf-8', 'ignore')[:200] if 'caption' in found else '',
+        'video_url': None
+    }
+
+
+def _build_reel(media, shortcode=None):
+    """Reel record from an API media item (media-info and clips feeds share the shape)"""
+    get = media.get
+    code = shortcode or get('code')
+    caption = get('caption')
+    video_versions = get('video_versions')
+    return {
+        'shortcode': code,
+        'url': f"https://www.instagram.com/reel/{code}/",
+        'views': get('play_count') or get('view_count') or 0,
+        'likes': get('like_count', 0),
+        'comments': get('comment_count', 0),
+        'caption': (caption.get('text') or '')[:200] if caption else '',
+        'video_url': video_versions[0].get('url') if video_versions else None
+    }
+
+
 def get_reel_info(session, shortcode):
     """Get view count and details for a single reel"""
     url = f"https://www.instagram.com/api/v1/media/{shortcode}/info/"
 
     try:
-        resp = session.get(url)
+        resp = instagram_request(session, 'GET', url)
         if resp.status_code == 200:
-            data = resp.json()
-            items = data.get('items', [])
+            data = json_loads(resp.content)
+            items = data.get('items')
             if items:
-                item = items[0]
-                return {
-                    'shortcode': shortcode,
-                    'url': f"https://www.instagram.com/reel/{shortcode}/",
-                    'views': item.get('play_count', 0) or item.get('view_count', 0),
-                    'likes': item.get('like_count', 0),
-                    'comments': item.get('comment_count', 0),
-                    'caption': (item.get('caption', {}) or {}).get('text', '')[:200],
-                    'video_url': item.get('video_versions', [{}])[0].get('url') if item.get('video_versions') else None
-                }
+                return _build_reel(items[0], shortcode)
     except:
         pass
 
-    # Fallback: scrape from page
+    # Fallback only when the API gave nothing usable: scrape from page
     try:
-        url = f"https://www.instagram.com/reel/{shortcode}/"
-        resp = session.get(url)
-        html = resp.text
-
-        views_match = re.search(r'"play_count":\s*(\d+)', html) or re.search(r'"video_view_count":\s*(\d+)', html)
-        likes_match = re.search(r'"like_count":\s*(\d+)', html)
-        caption_match = re.search(r'"text":\s*"([^"]{0,200})', html)
-
-        return {
-            'shortcode': shortcode,
-            'url': f"https://www.instagram.com/reel/{shortcode}/",
-            'views': int(views_match.group(1)) if views_match else 0,
-            'likes': int(likes_match.group(1)) if likes_match else 0,
-            'caption': caption_match.group(1) if caption_match else '',
-            'video_url': None
-        }
+        return _scrape_reel_html(session, shortcode)
     except:
         return None
 
 
-def get_user_reels(session, username, max_reels=50, progress_callback=None):
-    """Get list of reel shortcodes from user profile"""
-    reels = []
+# Successful web_profile_info lookups, reused when the same creator is scraped
+# again (re-runs from the UI, skeleton ripper jobs) within the TTL
+PROFILE_CACHE_TTL = 600  # seconds
+PROFILE_CACHE_MAX = 4096
+_profile_cache = {}  # username.lower() -> (expires, user_id, profile)
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_info(session, username):
+    """
+    Look up a user's ID and profile summary.
+    Returns (user_id, profile, error); successes are cached for PROFILE_CACHE_TTL.
+    """
+    key = username.lower()
+    now = time.monotonic()
+    with _profile_cache_lock:
+        cached = _profile_cache.get(key)
+    if cached and now < cached[0]:
+        logger.debug("SCRAPE", f"Profile cache hit for @{username}")
+        return cached[1], dict(cached[2], username=username), None
 
-    # First get user ID
     url = f"https://www.instagram.com/api/v1/users/web_profile_info/?username={username}"
     try:
-        resp = session.get(url)
+        resp = instagram_request(session, 'GET', url)
 
         # Check for non-200 status codes
         if resp.status_code == 404:
@@ -175,7 +358,7 @@ def get_user_reels(session, username, max_reels=50, progress_callback=None):
 
         # Try to parse JSON
         try:
-            data = resp.json()
+            data = json_loads(resp.content)
         except:
             return None, None, f"Account '@{username}' not found or cookies expired. Check spelling and re-export cookies if needed."
 
@@ -185,14 +368,18 @@ def get_user_reels(session, username, max_reels=50, progress_callback=None):
         if not user:
             return None, None, f"Account '@{username}' not found. Check the spelling."
 
-        user_id = user.get('id')
-        full_name = user.get('full_name', username)
-        followers = user.get('edge_followed_by', {}).get('count', 0)
-        is_private = user.get('is_private', False)
-
-        if is_private:
+        get = user.get
+        # Private accounts are rejected before anything else is extracted
+        if get('is_private', False):
             return None, None, f"Account '@{username}' is private. Can only scrape public profiles."
 
+        user_id = get('id')
+        full_name = get('full_name', username)
+        try:
+            followers = user['edge_followed_by']['count']
+        except (KeyError, TypeError):
+            followers = 0
+
         profile = {'full_name': full_name, 'followers': followers, 'username': username}
 
     except Exception as e:
@@ -201,6 +388,22 @@ def get_user_reels(session, username, max_reels=50, progress_callback=None):
             return None, None, f"Account '@{username}' not found or cookies expired."
         return None, None, f"Failed to fetch account: {error_str}"
 
+    with _profile_cache_lock:
+        if len(_profile_cache) >= PROFILE_CACHE_MAX:
+            _profile_cache.pop(next(iter(_profile_cache)))  # oldest insert
+        _profile_cache[key] = (now + PROFILE_CACHE_TTL, user_id, profile)
+    return user_id, dict(profile), None
+
+
+def get_user_reels(session, username, max_reels=50, progress_callback=None):
+    """Get list of reel shortcodes from user profile"""
+    reels = []
+
+    # First get user ID
+    user_id, profile, error = get_profile_info(session, username)
+    if error:
+        return None, None, error
+
     # Get reels via clips endpoint
     max_id = None
 
@@ -214,31 +417,20 @@ def get_user_reels(session, username, max_reels=50, progress_callback=None):
             data['max_id'] = max_id
 
         try:
-            resp = session.post(url, data=data)
+            resp = instagram_request(session, 'POST', url, data=data)
             if resp.status_code != 200:
                 break
 
-            result = resp.json()
+            result = json_loads(resp.content)
             items = result.get('items', [])
 
             if not items:
                 break
 
-            for item in items:
-                media = item.get('media', {})
-                reel = {
-                    'shortcode': media.get('code'),
-                    'url': f"https://www.instagram.com/reel/{media.get('code')}/",
-                    'views': media.get('play_count', 0),
-                    'likes': media.get('like_count', 0),
-                    'comments': media.get('comment_count', 0),
-                    'caption': (media.get('caption', {}) or {}).get('text', '')[:200],
-                    'video_url': media.get('video_versions', [{}])[0].get('url') if media.get('video_versions') else None
-                }
-                reels.append(reel)
-
-                if progress_callback:
-                    progress_callback(f"Found {len(reels)} reels...")
+            reels.extend(_build_reel(item.get('media') or {}) for item in items)
+            # Once per page - each callback is a UI status update
+            if progress_callback:
+                progress_callback(f"Found {len(reels)} reels...")
 
             if len(reels) >= max_reels:
                 break
@@ -248,16 +440,30 @@ def get_user_reels(session, username, max_reels=50, progress_callback=None):
                 break
             max_id = paging.get('max_id')
 
-            time.sleep(1)
-
         except Exception as e:
             break
 
     return reels, profile, None
 
 
-def download_video(reel_url, output_path, cookies_file, video_url=None, max_retries=3):
-    """Download video - tries direct URL first with retries, then yt-dlp"""
+DOWNLOAD_WORKERS = 4  # concurrent video downloads per scrape
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # bytes per read/write while streaming a video
+YT_DLP_TIMEOUT = 180  # seconds - whole yt-dlp run, CLI or in-process
+
+
+def _file_size(path):
+    """Size of path in bytes, or None if it doesn't exist - a single stat()"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def download_video(reel_url, output_path, cookies_file, video_url=None, max_retries=3, session=None):
+    """
+    Download video - tries direct URL first with retries, then yt-dlp.
+    Pass the scrape's session so direct downloads reuse its keep-alive pool.
+    """
     shortcode = os.path.basename(str(output_path)).split('_')[-1].replace('.mp4', '')
     logger.debug("DOWNLOAD", f"Starting download for {shortcode}", {
         "output_path": str(output_path),
@@ -269,27 +475,29 @@ def download_video(reel_url, output_path, cookies_file, video_url=None, max_retr
         for attempt in range(max_retries):
             try:
                 logger.debug("DOWNLOAD", f"Direct download attempt {attempt + 1}/{max_retries} for {shortcode}")
-                resp = requests.get(video_url, stream=True, timeout=120)
-
-                if resp.status_code == 200:
-                    with open(output_path, 'wb') as f:
-                        for chunk in resp.iter_content(chunk_size=8192):
-                            f.write(chunk)
-
-                    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                        file_size = os.path.getsize(output_path)
-                        logger.info("DOWNLOAD", f"Direct download successful: {shortcode}", {
-                            "file_size": file_size,
-                            "attempts": attempt + 1
-                        })
-                        return True
+                # Closed on every path so a failed attempt hands its connection back
+                with (session or requests).get(video_url, stream=True, timeout=120) as resp:
+                    if resp.status_code == 200:
+                        # Copy straight from the socket - skips iter_content's
+                        # generator layer; decode_content still undoes any gzip
+                        resp.raw.decode_content = True
+                        with open(output_path, 'wb') as f:
+                            shutil.copyfileobj(resp.raw, f, DOWNLOAD_CHUNK_SIZE)
+                            file_size = f.tell()
+
+                        if file_size > 0:
+                            logger.info("DOWNLOAD", f"Direct download successful: {shortcode}", {
+                                "file_size": file_size,
+                                "attempts": attempt + 1
+                            })
+                            return True
+                        else:
+                            logger.warning("DOWNLOAD", f"Downloaded file empty or missing: {shortcode}")
                     else:
-                        logger.warning("DOWNLOAD", f"Downloaded file empty or missing: {shortcode}")
-                else:
-                    logger.warning("DOWNLOAD", f"Direct download failed with status {resp.status_code}", {
-                        "shortcode": shortcode,
-                        "attempt": attempt + 1
-                    })
+                        logger.warning("DOWNLOAD", f"Direct download failed with status {resp.status_code}", {
+                            "shortcode": shortcode,
+                            "attempt": attempt + 1
+                        })
 
             except requests.exceptions.Timeout:
                 logger.warning("DOWNLOAD", f"Direct download timeout for {shortcode} (attempt {attempt + 1})")
@@ -313,18 +521,43 @@ def download_video(reel_url, output_path, cookies_file, video_url=None, max_retr
     logger.debug("DOWNLOAD", f"Trying yt-dlp fallback for {shortcode}")
     for attempt in range(max_retries):
         try:
-            import subprocess
-            result = subprocess.run([
-                'yt-dlp',
-                '--cookies', cookies_file,
-                '-o', str(output_path),
-                '--quiet',
-                '--no-warnings',
-                reel_url
-            ], capture_output=True, text=True, timeout=180)
-
-            if result.returncode == 0 and os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
+            if YT_DLP_AVAILABLE:
+                import yt_dlp
+                deadline = time.monotonic() + YT_DLP_TIMEOUT
+
+                def check_deadline(status):
+                    # socket_timeout only bounds single reads; cap the whole run
+                    if time.monotonic() > deadline:
+                        raise yt_dlp.utils.DownloadCancelled(
+                            f"exceeded {YT_DLP_TIMEOUT}s time limit")
+
+                ydl_opts = {
+                    'cookiefile': cookies_file,
+                    'outtmpl': str(output_path),
+                    'quiet': True,
+                    'no_warnings': True,
+                    'noprogress': True,
+                    'socket_timeout': YT_DLP_TIMEOUT,
+                    'progress_hooks': [check_deadline],
+                }
+                try:
+                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                        returncode, stderr = ydl.download([reel_url]), None
+                except (yt_dlp.utils.DownloadError, yt_dlp.utils.DownloadCancelled) as e:
+                    returncode, stderr = 1, str(e)
+            else:
+                result = subprocess.run([
+                    'yt-dlp',
+                    '--cookies', cookies_file,
+                    '-o', str(output_path),
+                    '--quiet',
+                    '--no-warnings',
+                    reel_url
+                ], capture_output=True, text=True, timeout=YT_DLP_TIMEOUT)
+                returncode, stderr = result.returncode, result.stderr
+
+            file_size = _file_size(output_path) if returncode == 0 else None
+            if file_size is not None:
                 logger.info("DOWNLOAD", f"yt-dlp download successful: {shortcode}", {
                     "file_size": file_size,
                     "attempts": attempt + 1
@@ -332,8 +565,8 @@ def download_video(reel_url, output_path, cookies_file, video_url=None, max_retr
                 return True
             else:
                 logger.warning("DOWNLOAD", f"yt-dlp failed for {shortcode}", {
-                    "returncode": result.returncode,
-                    "stderr": result.stderr[:200] if result.stderr else None,
+                    "returncode": returncode,
+                    "stderr": stderr[:200] if stderr else None,
                     "attempt": attempt + 1
                 })
 
@@ -355,8 +588,28 @@ def download_video(reel_url, output_path, cookies_file, video_url=None, max_retr
     return False
 
 
-def transcribe_video(video_path, model, output_path=None, progress_callback=None, video_index=None, total_videos=None):
-    """Transcribe video using local Whisper with heartbeat updates."""
+def load_whisper_audio(video_path):
+    """
+    Decode a video's audio track to Whisper's 16 kHz mono float32 input.
+    Returns None on failure so transcribe_video() can fall back to the file.
+    """
+    try:
+        if FASTER_WHISPER_AVAILABLE:
+            from faster_whisper import decode_audio
+            return decode_audio(str(video_path))
+        import whisper
+        return whisper.load_audio(str(video_path))
+    except Exception as e:
+        logger.debug("TRANSCRIBE", f"Audio pre-decode failed for {os.path.basename(str(video_path))}: {e}")
+        return None
+
+
+def transcribe_video(video_path, model, output_path=None, progress_callback=None, video_index=None,
+                     total_videos=None, audio=None):
+    """
+    Transcribe video using local Whisper with heartbeat updates.
+    Pass audio from load_whisper_audio() to skip decoding the file here.
+    """
     import threading
 
     video_name = os.path.basename(str(video_path))
@@ -385,7 +638,8 @@ def transcribe_video(video_path, model, output_path=None, progress_callback=None
         heartbeat_thread.start()
 
     try:
-        result = model.transcribe(str(video_path), language="en")
+        with _whisper_transcribe_lock:
+            result = model.transcribe(str(video_path) if audio is None else audio, language="en")
         transcript = result["text"].strip()
 
         # Save transcript if output path provided
@@ -409,30 +663,117 @@ def transcribe_video(video_path, model, output_path=None, progress_callback=None
             heartbeat_thread.join(timeout=1)
 
 
+TRANSCRIBE_API_WORKERS = 4  # concurrent OpenAI transcription uploads per scrape
+
+
+def _create_openai_session():
+    """Keep-alive session for api.openai.com, pooled for concurrent uploads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+    session.mount('https://', adapter)
+    return session
+
+
+_OPENAI_SESSION = _create_openai_session()
+
+
+class _MultipartUpload:
+    """
+    multipart/form-data body with one file part read from disk as it is sent.
+    requests' files= builds the whole body (video included) in memory first;
+    this exposes read() and len so requests streams it with a Content-Length.
+    """
+
+    def __init__(self, fields, name, fileobj, filename, content_type):
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        head = ''.join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'
+            for key, value in fields.items()
+        )
+        head += (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                 f'Content-Type: {content_type}\r\n\r\n')
+        head = head.encode('utf-8')
+        tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        self.len = len(head) + os.fstat(fileobj.fileno()).st_size + len(tail)
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+
+    def read(self, size=-1):
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b''.join(chunks)
+
+
+FFMPEG_PATH = shutil.which('ffmpeg')
+FFMPEG_TIMEOUT = 60  # seconds
+
+
+def extract_audio(video_path, audio_path):
+    """
+    Copy a video's audio track, without re-encoding, into an .m4a file.
+    Returns False when ffmpeg is missing or the copy fails.
+    """
+    if not FFMPEG_PATH:
+        return False
+    try:
+        result = subprocess.run([
+            FFMPEG_PATH, '-nostdin', '-loglevel', 'error', '-y',
+            '-i', str(video_path),
+            '-vn', '-c:a', 'copy',
+            str(audio_path)
+        ], capture_output=True, timeout=FFMPEG_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug("TRANSCRIBE", f"Audio extraction failed for {os.path.basename(str(video_path))}: {e}")
+        return False
+    return result.returncode == 0 and bool(_file_size(audio_path))
+
+
 def transcribe_video_openai(video_path, api_key, output_path=None, max_retries=3):
-    """Transcribe video using OpenAI Whisper API with retry logic."""
+    """
+    Transcribe video using OpenAI Whisper API with retry logic.
+    Only the audio track is uploaded when ffmpeg can split it out - a small
+    fraction of the video's size.
+    """
+    with tempfile.TemporaryDirectory(prefix='reelrecon_') as temp_dir:
+        audio_path = Path(temp_dir) / (Path(str(video_path)).stem + '.m4a')
+        if extract_audio(video_path, audio_path):
+            upload_path, content_type = audio_path, 'audio/mp4'
+        else:
+            upload_path, content_type = video_path, 'video/mp4'
+        return _transcribe_openai_upload(video_path, upload_path, content_type, api_key, output_path, max_retries)
+
+
+def _transcribe_openai_upload(video_path, upload_path, content_type, api_key, output_path, max_retries):
     video_name = os.path.basename(str(video_path))
     url = "https://api.openai.com/v1/audio/transcriptions"
 
-    logger.debug("TRANSCRIBE", f"Starting OpenAI transcription: {video_name}")
+    logger.debug("TRANSCRIBE", f"Starting OpenAI transcription: {video_name}", {
+        "upload": content_type
+    })
 
     for attempt in range(max_retries):
         try:
-            # Read the video file
-            with open(video_path, 'rb') as audio_file:
-                files = {
-                    'file': (os.path.basename(video_path), audio_file, 'video/mp4')
-                }
+            # Stream the file as the upload body
+            with open(upload_path, 'rb') as audio_file:
                 data = {
                     'model': 'whisper-1',
                     'language': 'en',
                     'response_format': 'text'
                 }
+                body = _MultipartUpload(data, 'file', audio_file, os.path.basename(str(upload_path)), content_type)
                 headers = {
-                    'Authorization': f'Bearer {api_key}'
+                    'Authorization': f'Bearer {api_key}',
+                    'Content-Type': body.content_type
                 }
 
-                response = requests.post(url, headers=headers, files=files, data=data, timeout=300)
+                response = _OPENAI_SESSION.post(url, headers=headers, data=body, timeout=300)
 
                 if response.status_code == 200:
                     transcript = response.text.strip()
@@ -441,10 +782,10 @@ def transcribe_video_openai(video_path, api_key, output_path=None, max_retries=3
                         "attempts": attempt + 1
                     })
 
-                    # Save transcript if output path provided
+                    # Save transcript if output path provided - the response
+                    # body is already UTF-8, so write it without re-encoding
                     if output_path and transcript:
-                        with open(output_path, 'w', encoding='utf-8') as f:
-                            f.write(transcript)
+                        Path(output_path).write_bytes(response.content.strip())
 
                     return transcript
 
@@ -493,18 +834,49 @@ def get_whisper_cache_dir():
 
 
 def load_whisper_model(model_name='small.en', max_retries=3, progress_callback=None):
-    """Load Whisper model with retry logic - forces CPU mode for WSL compatibility"""
+    """
+    Load Whisper model with retry logic - forces CPU mode for WSL compatibility.
+    Loaded models are reused by later calls for the same model name.
+    """
     if not WHISPER_AVAILABLE:
         logger.warning("WHISPER", "whisper module not available - install with: pip install openai-whisper")
         return None
 
-    import torch
+    # Force CPU mode for WSL compatibility (CUDA often fails in WSL)
+    device = "cpu"
+    key = (model_name, device)
+
+    # Held across the load so concurrent scrapes wait for one copy
+    with _whisper_models_lock:
+        model = _whisper_models.get(key)
+        if model is None:
+            model = _load_whisper_model(model_name, device, max_retries, progress_callback)
+            if model is not None:
+                _whisper_models[key] = model
+        else:
+            logger.debug("WHISPER", f"Reusing loaded model '{model_name}'")
+    return model
+
+
+class _FasterWhisperModel:
+    """faster-whisper model behind openai-whisper's transcribe() -> {'text': ...} interface"""
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, language=None):
+        # Greedy decoding like openai-whisper's transcribe(); segments are
+        # produced lazily, so joining them is where the work happens
+        segments, _info = self.model.transcribe(audio, language=language, beam_size=1)
+        return {'text': ''.join(segment.text for segment in segments)}
+
+
+def _load_whisper_model(model_name, device, max_retries, progress_callback):
     last_error = None
     cache_dir = get_whisper_cache_dir()
 
-    # Force CPU mode for WSL compatibility (CUDA often fails in WSL)
-    device = "cpu"
     logger.info("WHISPER", f"Loading model '{model_name}'", {
+        "backend": "faster-whisper" if FASTER_WHISPER_AVAILABLE else "openai-whisper",
         "cache_dir": cache_dir,
         "device": device
     })
@@ -515,7 +887,13 @@ def load_whisper_model(model_name='small.en', max_retries=3, progress_callback=N
                 progress_callback(f"Loading Whisper model ({model_name}) - retry {attempt + 1}/{max_retries}...")
 
             # Force CPU to avoid CUDA issues in WSL
-            model = whisper.load_model(model_name, device=device, download_root=cache_dir)
+            if FASTER_WHISPER_AVAILABLE:
+                from faster_whisper import WhisperModel
+                model = _FasterWhisperModel(
+                    WhisperModel(model_name, device=device, compute_type=FASTER_WHISPER_COMPUTE_TYPE))
+            else:
+                import whisper
+                model = whisper.load_model(model_name, device=device, download_root=cache_dir)
             if model is not None:
                 logger.info("WHISPER", f"Model '{model_name}' loaded successfully", {
                     "device": device,
@@ -566,8 +944,6 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
         transcribe_provider: 'local' for local Whisper, 'openai' for OpenAI API
         openai_key: OpenAI API key (required if transcribe_provider='openai')
     """
-    import uuid
-
     scrape_id = str(uuid.uuid4())
     logger.info("SCRAPE", f"Starting scrape for @{username}", {
         "scrape_id": scrape_id,
@@ -648,9 +1024,8 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
         "followers": profile.get('followers') if profile else None
     })
 
-    # Sort by views
-    reels_sorted = sorted(reels, key=lambda x: x.get('views', 0), reverse=True)
-    top_reels = reels_sorted[:top_n]
+    # Top N by views - a bounded heap instead of sorting every reel
+    top_reels = heapq.nlargest(top_n, reels, key=lambda x: x.get('views', 0) or 0)
 
     logger.debug("SCRAPE", f"Selected top {len(top_reels)} reels by views")
 
@@ -662,10 +1037,24 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
     output_dir.mkdir(parents=True, exist_ok=True)
     results['output_dir'] = str(output_dir)
 
-    # Download videos if requested
+    # Local Whisper only needs the audio: when the videos aren't being kept,
+    # ffmpeg decodes it straight from the CDN URL and the MP4 never hits disk
+    stream_audio = transcribe and not download and transcribe_provider == 'local' and WHISPER_AVAILABLE
+
+    # Download videos if requested. Downloads run in the background and each
+    # transcriber consumes a video as soon as it lands, so network and
+    # transcription overlap instead of running back to back
+    downloads = {}  # rank -> (future, filepath) until recorded
+    download_stats = {'done': 0, 'total': 0, 'success': 0, 'failed': 0}
+    download_pool = None
     if download or transcribe:
+        to_download = [
+            (i, reel) for i, reel in enumerate(top_reels, 1)
+            if not (stream_audio and reel.get('video_url'))
+        ]
         logger.info("SCRAPE", f"Starting video downloads for @{username}", {
-            "video_count": len(top_reels)
+            "video_count": len(to_download),
+            "streamed": len(top_reels) - len(to_download)
         })
 
         if progress_callback:
@@ -673,33 +1062,44 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
 
         video_dir = output_dir / "videos"
         video_dir.mkdir(exist_ok=True)
-        download_success = 0
-        download_failed = 0
-
-        for i, reel in enumerate(top_reels, 1):
-            if progress_callback:
-                progress_callback(f"Downloading video {i}/{len(top_reels)}...")
-
-            filename = f"{i:02d}_{reel['views']}views_{reel['shortcode']}.mp4"
-            filepath = video_dir / filename
-
-            if download_video(reel['url'], filepath, cookies_path, reel.get('video_url')):
-                reel['local_video'] = str(filepath)
-                download_success += 1
-            else:
-                reel['local_video'] = None
-                download_failed += 1
-                results['download_errors'].append({
-                    'shortcode': reel['shortcode'],
-                    'error': 'Download failed after retries'
-                })
+        download_stats['total'] = len(to_download)
+
+        # Downloads are network-bound; a small pool keeps several in flight
+        download_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="download")
+        for i, reel in to_download:
+            filepath = video_dir / f"{i:02d}_{reel['views']}views_{reel['shortcode']}.mp4"
+            future = download_pool.submit(download_video, reel['url'], filepath, cookies_path,
+                                          reel.get('video_url'), session=session)
+            downloads[i] = (future, filepath)
+
+    def record_download(i):
+        """Wait for reel i's download (if any) and record the outcome on the reel"""
+        entry = downloads.pop(i, None)
+        if entry is None:
+            return
+        future, filepath = entry
+        reel = top_reels[i - 1]
+        download_stats['done'] += 1
+        if progress_callback:
+            progress_callback(f"Downloaded video {download_stats['done']}/{download_stats['total']}...")
 
-            time.sleep(0.5)
+        if future.result():
+            reel['local_video'] = str(filepath)
+            download_stats['success'] += 1
+        else:
+            reel['local_video'] = None
+            download_stats['failed'] += 1
+            results['download_errors'].append({
+                'shortcode': reel['shortcode'],
+                'error': 'Download failed after retries'
+            })
 
-        logger.info("SCRAPE", f"Downloads complete for @{username}", {
-            "success": download_success,
-            "failed": download_failed
-        })
+    def completed_downloads():
+        """Yield reel ranks as their downloads finish, recording each one"""
+        pending = {future: i for i, (future, _) in downloads.items()}
+        for future in as_completed(pending):
+            record_download(pending[future])
+            yield pending[future]
 
     # Transcribe if requested
     if transcribe:
@@ -718,33 +1118,43 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
                 progress_callback("Transcribing with OpenAI Whisper API...")
 
             transcription_success = 0
-            for i, reel in enumerate(top_reels, 1):
-                if progress_callback:
-                    progress_callback(f"Transcribing {i}/{len(top_reels)} (OpenAI API)...")
-
-                try:
+            # Each request is dominated by upload + server time, so run several at once
+            with ThreadPoolExecutor(max_workers=TRANSCRIBE_API_WORKERS, thread_name_prefix="transcribe") as pool:
+                futures = {}
+                # Upload each video as soon as its download lands
+                for i in completed_downloads():
+                    reel = top_reels[i - 1]
                     video_path = reel.get('local_video')
                     if video_path and os.path.exists(video_path):
                         transcript_file = transcript_dir / f"{i:02d}_{reel['shortcode']}.txt"
-                        transcript = transcribe_video_openai(video_path, openai_key, transcript_file)
+                        future = pool.submit(transcribe_video_openai, video_path, openai_key, transcript_file)
+                        futures[future] = (reel, transcript_file)
+                    else:
+                        reel['transcript'] = None
+                        reel['transcript_file'] = None
+                        logger.warning("SCRAPE", f"Video file missing for transcription: {reel.get('shortcode')}")
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    reel, transcript_file = futures[future]
+                    if progress_callback:
+                        progress_callback(f"Transcribed {done}/{len(futures)} (OpenAI API)...")
+
+                    try:
+                        transcript = future.result()
                         reel['transcript'] = transcript
                         reel['transcript_file'] = str(transcript_file) if transcript else None
                         if transcript:
                             transcription_success += 1
-                    else:
+                    except Exception as e:
                         reel['transcript'] = None
                         reel['transcript_file'] = None
-                        logger.warning("SCRAPE", f"Video file missing for transcription: {reel.get('shortcode')}")
-                except Exception as e:
-                    reel['transcript'] = None
-                    reel['transcript_file'] = None
-                    results['transcription_errors'].append({
-                        'shortcode': reel.get('shortcode'),
-                        'error': str(e)
-                    })
-                    logger.warning("SCRAPE", f"Transcription failed for {reel.get('shortcode')}", exception=e)
-                    if progress_callback:
-                        progress_callback(f"Transcription failed for {reel.get('shortcode')}, continuing...")
+                        results['transcription_errors'].append({
+                            'shortcode': reel.get('shortcode'),
+                            'error': str(e)
+                        })
+                        logger.warning("SCRAPE", f"Transcription failed for {reel.get('shortcode')}", exception=e)
+                        if progress_callback:
+                            progress_callback(f"Transcription failed for {reel.get('shortcode')}, continuing...")
 
         # Use local Whisper model
         elif transcribe_provider == 'local' and WHISPER_AVAILABLE:
@@ -762,19 +1172,49 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
 
             if model:
                 transcription_success = 0
+                # ffmpeg decodes the next reel's audio (once it has downloaded)
+                # while the model works on the current one, so the model never
+                # sits waiting on decoding
+                decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-decode")
+
+                def decode_download(future, filepath):
+                    return load_whisper_audio(filepath) if future.result() else None
+
+                def decode(i):
+                    reel = top_reels[i - 1]
+                    if i in downloads:
+                        return decoder.submit(decode_download, *downloads[i])
+                    if stream_audio and reel.get('video_url'):
+                        return decoder.submit(load_whisper_audio, reel['video_url'])
+                    return None
+
+                next_audio = decode(1) if top_reels else None
                 for i, reel in enumerate(top_reels, 1):
+                    audio_future = next_audio
+                    next_audio = decode(i + 1) if i < len(top_reels) else None
+                    record_download(i)
+
                     if progress_callback:
                         progress_callback(f"Transcribing {i}/{len(top_reels)} (Local)...")
 
                     try:
+                        audio = audio_future.result() if audio_future else None
                         video_path = reel.get('local_video')
-                        if video_path and os.path.exists(video_path):
+                        if audio is None and not video_path and stream_audio:
+                            # Streaming the audio failed - fall back to a temporary download
+                            filepath = video_dir / f"{i:02d}_{reel['views']}views_{reel['shortcode']}.mp4"
+                            if download_video(reel['url'], filepath, cookies_path, reel.get('video_url'),
+                                              session=session):
+                                video_path = reel['local_video'] = str(filepath)
+
+                        if audio is not None or (video_path and os.path.exists(video_path)):
                             transcript_file = transcript_dir / f"{i:02d}_{reel['shortcode']}.txt"
                             transcript = transcribe_video(
-                                video_path, model, transcript_file,
+                                video_path or reel['video_url'], model, transcript_file,
                                 progress_callback=progress_callback,
                                 video_index=i,
-                                total_videos=len(top_reels)
+                                total_videos=len(top_reels),
+                                audio=audio
                             )
                             reel['transcript'] = transcript
                             reel['transcript_file'] = str(transcript_file) if transcript else None
@@ -794,6 +1234,7 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
                         })
                         if progress_callback:
                             progress_callback(f"Transcription failed for {reel.get('shortcode')}, continuing...")
+                decoder.shutdown(wait=False)
 
                 logger.info("SCRAPE", f"Local transcriptions complete for @{username}", {
                     "success": transcription_success,
@@ -816,19 +1257,30 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
                 reel['transcript'] = None
                 reel['transcript_file'] = None
 
-        # Clean up videos if not keeping them
-        if not download:
-            logger.debug("SCRAPE", "Cleaning up temporary video files")
-            if progress_callback:
-                progress_callback("Cleaning up temporary videos...")
-            for reel in top_reels:
-                video_path = reel.get('local_video')
-                if video_path and os.path.exists(video_path):
-                    try:
-                        os.remove(video_path)
-                    except Exception as e:
-                        logger.warning("SCRAPE", f"Failed to remove temp video: {video_path}")
-                reel['local_video'] = None
+    # Record whatever transcription didn't consume (download-only runs, or
+    # no usable transcriber)
+    if download_pool is not None:
+        for _ in completed_downloads():
+            pass
+        download_pool.shutdown()
+        logger.info("SCRAPE", f"Downloads complete for @{username}", {
+            "success": download_stats['success'],
+            "failed": download_stats['failed']
+        })
+
+    # Clean up videos if not keeping them
+    if transcribe and not download:
+        logger.debug("SCRAPE", "Cleaning up temporary video files")
+        if progress_callback:
+            progress_callback("Cleaning up temporary videos...")
+        for reel in top_reels:
+            video_path = reel.get('local_video')
+            if video_path and os.path.exists(video_path):
+                try:
+                    os.remove(video_path)
+                except Exception as e:
+                    logger.warning("SCRAPE", f"Failed to remove temp video: {video_path}")
+            reel['local_video'] = None
 
     results['top_reels'] = top_reels
 
@@ -857,8 +1309,7 @@ def run_scrape(username, cookies_path, max_reels=100, top_n=10, download=False,
     # Save JSON report
     try:
         report_path = output_dir / f"reels_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        report_path.write_bytes(json_dumps(results, pretty=True))
         results['report_path'] = str(report_path)
         logger.debug("SCRAPE", f"Report saved to {report_path}")
     except Exception as e:
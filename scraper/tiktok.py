@@ -3,19 +3,27 @@ ReelRecon - TikTok Scraping Module
 TikTok profile and video extraction using yt-dlp
 """
 
-import json
 import os
 import time
+import heapq
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+from utils import json_dumps
+
 try:
     import yt_dlp
     YT_DLP_AVAILABLE = True
 except ImportError:
     YT_DLP_AVAILABLE = False
 
+# Video downloads go to TikTok itself through yt-dlp (not to a CDN URL), so
+# only a couple run at once and each worker pauses between downloads
+TIKTOK_DOWNLOAD_WORKERS = 2
+TIKTOK_DOWNLOAD_DELAY = 0.5  # seconds
+
 
 def generate_error_code(error_msg, prefix="TIK"):
     """Generate a trackable error code"""
@@ -190,7 +198,8 @@ def run_tiktok_scrape(username, cookies_path, max_videos=50, top_n=10, download=
     Compatible with the same interface as run_scrape for Instagram
     """
     import uuid
-    from .core import WHISPER_AVAILABLE, load_whisper_model, transcribe_video, transcribe_video_openai
+    from .core import (WHISPER_AVAILABLE, TRANSCRIBE_API_WORKERS, load_whisper_model,
+                       transcribe_video, transcribe_video_openai)
 
     results = {
         'id': str(uuid.uuid4()),
@@ -235,9 +244,8 @@ def run_tiktok_scrape(username, cookies_path, max_videos=50, top_n=10, download=
         results['error'] = f"[{results['error_code']}] {err}"
         return results
 
-    # Sort by plays (views)
-    videos_sorted = sorted(videos, key=lambda x: x.get('plays', 0) or 0, reverse=True)
-    top_videos = videos_sorted[:top_n]
+    # Top N by plays (views) - a bounded heap instead of sorting every video
+    top_videos = heapq.nlargest(top_n, videos, key=lambda x: x.get('plays', 0) or 0)
 
     if progress_callback:
         progress_callback(f"Top {len(top_videos)} videos selected by view count...")
@@ -279,19 +287,21 @@ def run_tiktok_scrape(username, cookies_path, max_videos=50, top_n=10, download=
         video_dir = output_dir / "videos"
         video_dir.mkdir(exist_ok=True)
 
-        for i, reel in enumerate(top_reels, 1):
-            if progress_callback:
-                progress_callback(f"Downloading video {i}/{len(top_reels)}...")
-
+        def fetch(i, reel):
             filename = f"{i:02d}_{reel['views']}views_{reel['shortcode']}.mp4"
             filepath = video_dir / filename
-
-            if download_tiktok_video(reel['url'], str(filepath), cookies_path):
-                reel['local_video'] = str(filepath)
-            else:
-                reel['local_video'] = None
-
-            time.sleep(0.5)
+            ok = download_tiktok_video(reel['url'], str(filepath), cookies_path)
+            time.sleep(TIKTOK_DOWNLOAD_DELAY)
+            return reel, str(filepath) if ok else None
+
+        # Each download is a separate yt-dlp instance
+        with ThreadPoolExecutor(max_workers=TIKTOK_DOWNLOAD_WORKERS) as pool:
+            futures = [pool.submit(fetch, i, reel) for i, reel in enumerate(top_reels, 1)]
+            for done, future in enumerate(as_completed(futures), 1):
+                reel, local_video = future.result()
+                reel['local_video'] = local_video
+                if progress_callback:
+                    progress_callback(f"Downloaded video {done}/{len(top_reels)}...")
 
     # Transcribe if requested
     if transcribe:
@@ -305,25 +315,33 @@ def run_tiktok_scrape(username, cookies_path, max_videos=50, top_n=10, download=
             if progress_callback:
                 progress_callback("Transcribing with OpenAI Whisper API...")
 
-            for i, reel in enumerate(top_reels, 1):
-                if progress_callback:
-                    progress_callback(f"Transcribing {i}/{len(top_reels)} (OpenAI API)...")
-
-                try:
+            # API calls are network-bound - keep a few uploads in flight
+            with ThreadPoolExecutor(max_workers=TRANSCRIBE_API_WORKERS) as pool:
+                futures = {}
+                for i, reel in enumerate(top_reels, 1):
                     video_path = reel.get('local_video')
                     if video_path and os.path.exists(video_path):
                         transcript_file = transcript_dir / f"{i:02d}_{reel['shortcode']}.txt"
-                        transcript = transcribe_video_openai(video_path, openai_key, transcript_file)
-                        reel['transcript'] = transcript
-                        reel['transcript_file'] = str(transcript_file) if transcript else None
+                        future = pool.submit(transcribe_video_openai, video_path, openai_key, transcript_file)
+                        futures[future] = (reel, transcript_file)
                     else:
                         reel['transcript'] = None
                         reel['transcript_file'] = None
-                except Exception as e:
-                    reel['transcript'] = None
-                    reel['transcript_file'] = None
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    reel, transcript_file = futures[future]
                     if progress_callback:
-                        progress_callback(f"Transcription failed for {reel.get('shortcode')}, continuing...")
+                        progress_callback(f"Transcribed {done}/{len(futures)} (OpenAI API)...")
+
+                    try:
+                        transcript = future.result()
+                        reel['transcript'] = transcript
+                        reel['transcript_file'] = str(transcript_file) if transcript else None
+                    except Exception as e:
+                        reel['transcript'] = None
+                        reel['transcript_file'] = None
+                        if progress_callback:
+                            progress_callback(f"Transcription failed for {reel.get('shortcode')}, continuing...")
 
         # Use local Whisper model
         elif transcribe_provider == 'local' and WHISPER_AVAILABLE:
@@ -394,8 +412,7 @@ def run_tiktok_scrape(username, cookies_path, max_videos=50, top_n=10, download=
     # Save JSON report
     try:
         report_path = output_dir / f"tiktok_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        report_path.write_bytes(json_dumps(results, pretty=True))
         results['report_path'] = str(report_path)
     except Exception as e:
         results['report_path'] = None
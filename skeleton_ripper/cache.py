@@ -11,7 +11,9 @@ Cache Strategy:
 """
 
 import os
+import re
 import hashlib
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -19,6 +21,17 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Caption noise that makes a transcript worthless when it dominates the text
+GARBAGE_PATTERNS = (
+    'music',  # Just "[Music]" captions
+    '♪',
+    'subscribe',  # Auto-generated subscribe reminders only
+    '[applause]',
+    '[laughter]',
+)
+# One case-insensitive pass finds every pattern (none of them overlap)
+_GARBAGE_RE = re.compile('|'.join(map(re.escape, GARBAGE_PATTERNS)), re.IGNORECASE)
+
 
 class TranscriptCache:
     """
@@ -190,21 +203,10 @@ class TranscriptCache:
         if word_count < 10:
             return False
 
-        # Check for common garbage patterns
-        garbage_patterns = [
-            'music',  # Just "[Music]" captions
-            '♪',
-            'subscribe',  # Auto-generated subscribe reminders only
-            '[applause]',
-            '[laughter]',
-        ]
-
-        transcript_lower = transcript.lower()
-
         # If transcript is mostly garbage patterns, reject it
-        for pattern in garbage_patterns:
-            if transcript_lower.count(pattern) > word_count // 2:
-                return False
+        counts = Counter(match.lower() for match in _GARBAGE_RE.findall(transcript))
+        if any(count > word_count // 2 for count in counts.values()):
+            return False
 
         return True
 
@@ -15,6 +15,7 @@ import json
 import uuid
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
@@ -41,6 +42,9 @@ from scraper.core import (
 
 logger = get_logger()
 
+# Creators whose reel metadata is fetched concurrently (bounded to stay polite)
+REEL_FETCH_WORKERS = 4
+
 
 # =============================================================================
 # JOB STATUS
@@ -394,6 +398,53 @@ class SkeletonRipperPipeline:
         temp_dir = self.base_dir / 'output' / 'skeleton_temp'
         temp_dir.mkdir(parents=True, exist_ok=True)
 
+        # Check the cache for every creator up front, then fetch reel metadata
+        # for the rest in parallel - the per-creator loop below only waits on
+        # its own fetch while later creators' requests are already in flight
+        cached_by_user = {
+            username: self._get_cached_transcripts(
+                config.platform, username, config.videos_per_creator
+            )
+            for username in config.usernames
+        }
+        to_fetch = [
+            username for username in dict.fromkeys(config.usernames)
+            if len(cached_by_user[username]) < config.videos_per_creator
+        ]
+        fetch_pool = ThreadPoolExecutor(
+            max_workers=max(1, min(REEL_FETCH_WORKERS, len(to_fetch))),
+            thread_name_prefix='skeleton-fetch'
+        )
+        reel_fetches = {
+            username: fetch_pool.submit(get_user_reels, session, username, max_reels=100)
+            for username in to_fetch
+        }
+
+        try:
+            self._process_creators(
+                config, progress, on_progress, transcripts, cached_by_user,
+                reel_fetches, session, temp_dir, cookies_path, openai_key, whisper_model
+            )
+        finally:
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+
+        return transcripts
+
+    def _process_creators(
+        self,
+        config: JobConfig,
+        progress: JobProgress,
+        on_progress: Optional[Callable],
+        transcripts: list[dict],
+        cached_by_user: dict,
+        reel_fetches: dict,
+        session,
+        temp_dir: Path,
+        cookies_path: str,
+        openai_key: Optional[str],
+        whisper_model
+    ):
+        """Download/transcribe each creator's top reels in order, appending to transcripts."""
         for idx, username in enumerate(config.usernames):
             logger.info("SKELETON", f"Processing creator {idx + 1}/{len(config.usernames)}: @{username}")
             progress.current_creator = username
@@ -405,9 +456,7 @@ class SkeletonRipperPipeline:
             self._notify(on_progress, progress)
 
             # Check cache for this creator first
-            cached_transcripts = self._get_cached_transcripts(
-                config.platform, username, config.videos_per_creator
-            )
+            cached_transcripts = cached_by_user[username]
 
             if cached_transcripts and len(cached_transcripts) >= config.videos_per_creator:
                 # Have enough cached - use those
@@ -426,7 +475,7 @@ class SkeletonRipperPipeline:
             self._notify(on_progress, progress)
 
             try:
-                reels, profile, error = get_user_reels(session, username, max_reels=100)
+                reels, profile, error = reel_fetches[username].result()
 
                 if error:
                     logger.warning("SKELETON", f"Failed to fetch reels for @{username}: {error}")
@@ -501,7 +550,8 @@ class SkeletonRipperPipeline:
                         reel_url=reel.get('url', ''),
                         output_path=str(video_path),
                         cookies_file=cookies_path,
-                        video_url=reel.get('video_url')
+                        video_url=reel.get('video_url'),
+                        session=session
                     )
 
                     if not download_success or not video_path.exists():
@@ -586,8 +636,6 @@ class SkeletonRipperPipeline:
                     f"@{username}: Only {valid_count}/{config.videos_per_creator} valid transcripts"
                 )
 
-        return transcripts
-
     def _get_cached_transcripts(
         self,
         platform: str,
@@ -260,7 +260,7 @@ async function executeScrape(scrapeData) {
         }
 
         currentScrapeId = data.scrape_id;
-        pollScrapeStatus();
+        watchScrapeStatus();
 
     } catch (error) {
         showError(error.message);
@@ -290,64 +290,7 @@ async function pollScrapeStatus() {
 
         const data = await response.json();
 
-        const progress = data.progress || '';
-        const progressPct = data.progress_pct || 0;
-
-        // Update progress text with phase info if available
-        let displayProgress = progress || 'Processing...';
-        if (data.phase && data.phase !== 'initializing') {
-            const phaseNames = {
-                'authenticating': 'Authenticating',
-                'fetching_profile': 'Fetching Profile',
-                'discovering_content': 'Discovering Content',
-                'downloading': 'Downloading',
-                'transcribing': 'Transcribing',
-                'processing': 'Processing',
-                'finalizing': 'Finalizing'
-            };
-            const phaseName = phaseNames[data.phase] || data.phase;
-            if (data.current_item && data.total_items) {
-                displayProgress = `${phaseName}: ${data.current_item}/${data.total_items}`;
-            }
-        }
-        progressText.textContent = displayProgress;
-
-        // Update progress bar based on percentage or message fallback
-        if (progressPct > 0) {
-            progressFill.style.width = `${progressPct}%`;
-        } else if (progress.includes('Found')) {
-            progressFill.style.width = '30%';
-        } else if (progress.includes('Downloading')) {
-            progressFill.style.width = '50%';
-        } else if (progress.includes('Transcribing') || progress.includes('Loading Whisper')) {
-            progressFill.style.width = '70%';
-        } else if (progress.includes('Cleaning')) {
-            progressFill.style.width = '90%';
-        }
-
-        if (data.status === 'complete' || data.status === 'partial') {
-            progressFill.style.width = '100%';
-
-            // Show warning for partial completion
-            if (data.status === 'partial') {
-                progressFill.style.background = 'linear-gradient(90deg, var(--color-success), var(--color-warning))';
-                progressText.innerHTML = `<span style="color: var(--color-warning);">Completed with some errors. Check results.</span>`;
-            }
-
-            currentResults = data.result;
-            renderResults(data.result);
-            resetForm();
-            refreshHistory();
-            // Switch to list view to show new results
-            if (currentView === 'gallery') {
-                switchView('list');
-            }
-        } else if (data.status === 'error') {
-            const errorMsg = data.error_message || data.result?.error || 'Scrape failed';
-            throw { message: errorMsg, code: data.error_code };
-        } else if (data.status === 'aborted') {
-            throw { message: 'Scrape was aborted', code: 'ABORTED' };
-        } else {
+        if (!handleScrapeStatus(data)) {
             // Continue polling
             setTimeout(pollScrapeStatus, 1000);
         }
@@ -361,6 +304,105 @@ async function pollScrapeStatus() {
     }
 }
 
+// Follow scrape progress over Server-Sent Events; falls back to polling
+function watchScrapeStatus() {
+    if (!currentScrapeId) return;
+    if (!window.EventSource) {
+        pollScrapeStatus();
+        return;
+    }
+
+    const scrapeId = currentScrapeId;
+    const source = new EventSource(`/api/scrape/${scrapeId}/events`);
+    const state = {};
+
+    source.onmessage = (event) => {
+        // Events carry only the fields that changed since the previous one
+        Object.assign(state, JSON.parse(event.data));
+        try {
+            if (handleScrapeStatus(state)) {
+                source.close();
+            }
+        } catch (error) {
+            source.close();
+            showError(error.message || String(error), error.code || null);
+            resetForm();
+        }
+    };
+
+    source.onerror = () => {
+        // Stream dropped before completion - don't let EventSource reconnect, poll instead
+        source.close();
+        if (currentScrapeId === scrapeId) {
+            pollScrapeStatus();
+        }
+    };
+}
+
+// Apply a scrape status payload to the UI. Returns true once the scrape has
+// finished; throws {message, code} for failed or aborted scrapes.
+function handleScrapeStatus(data) {
+    const progress = data.progress || '';
+    const progressPct = data.progress_pct || 0;
+
+    // Update progress text with phase info if available
+    let displayProgress = progress || 'Processing...';
+    if (data.phase && data.phase !== 'initializing') {
+        const phaseNames = {
+            'authenticating': 'Authenticating',
+            'fetching_profile': 'Fetching Profile',
+            'discovering_content': 'Discovering Content',
+            'downloading': 'Downloading',
+            'transcribing': 'Transcribing',
+            'processing': 'Processing',
+            'finalizing': 'Finalizing'
+        };
+        const phaseName = phaseNames[data.phase] || data.phase;
+        if (data.current_item && data.total_items) {
+            displayProgress = `${phaseName}: ${data.current_item}/${data.total_items}`;
+        }
+    }
+    progressText.textContent = displayProgress;
+
+    // Update progress bar based on percentage or message fallback
+    if (progressPct > 0) {
+        progressFill.style.width = `${progressPct}%`;
+    } else if (progress.includes('Found')) {
+        progressFill.style.width = '30%';
+    } else if (progress.includes('Downloading')) {
+        progressFill.style.width = '50%';
+    } else if (progress.includes('Transcribing') || progress.includes('Loading Whisper')) {
+        progressFill.style.width = '70%';
+    } else if (progress.includes('Cleaning')) {
+        progressFill.style.width = '90%';
+    }
+
+    if (data.status === 'complete' || data.status === 'partial') {
+        progressFill.style.width = '100%';
+
+        // Show warning for partial completion
+        if (data.status === 'partial') {
+            progressFill.style.background = 'linear-gradient(90deg, var(--color-success), var(--color-warning))';
+            progressText.innerHTML = `<span style="color: var(--color-warning);">Completed with some errors. Check results.</span>`;
+        }
+
+        currentResults = data.result;
+        renderResults(data.result);
+        resetForm();
+        refreshHistory();
+        // Switch to list view to show new results
+        if (currentView === 'gallery') {
+            switchView('list');
+        }
+    } else if (data.status === 'error') {
+        const errorMsg = data.error_message || data.result?.error || 'Scrape failed';
+        throw { message: errorMsg, code: data.error_code };
+    } else if (data.status === 'aborted') {
+        throw { message: 'Scrape was aborted', code: 'ABORTED' };
+    }
+    return data.status === 'complete' || data.status === 'partial';
+}
+
 // Render results
 function renderResults(result) {
     const platform = result?.platform || 'instagram';
@@ -1201,6 +1243,8 @@ async function loadSettings() {
         document.getElementById('openaiModel').value = settings.openai_model || 'gpt-4o-mini';
         document.getElementById('anthropicModel').value = settings.anthropic_model || 'claude-3-5-haiku-20241022';
         document.getElementById('googleModel').value = settings.google_model || 'gemini-1.5-flash';
+        const prefetchRewrites = document.getElementById('prefetchRewrites');
+        if (prefetchRewrites) prefetchRewrites.checked = !!settings.prefetch_rewrites;
 
         // Update key status indicators
         if (settings.has_openai_key) {
@@ -1247,7 +1291,8 @@ async function saveSettings() {
         openai_model: document.getElementById('openaiModel').value,
         anthropic_model: document.getElementById('anthropicModel').value,
         google_model: document.getElementById('googleModel').value,
-        output_directory: document.getElementById('outputDirectory').value.trim()
+        output_directory: document.getElementById('outputDirectory').value.trim(),
+        prefetch_rewrites: !!document.getElementById('prefetchRewrites')?.checked
     };
 
     // Only include keys if they have values
@@ -1710,20 +1755,18 @@ async function generateQuickRewrite() {
     `;
 
     try {
-        const response = await fetch('/api/rewrite', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                scrape_id: currentRewriteReel.scrapeId,
-                shortcode: currentRewriteReel.shortcode,
-                context: context,
-                provider: provider,
-                model: model
-            })
+        const data = await requestRewrite({
+            scrape_id: currentRewriteReel.scrapeId,
+            shortcode: currentRewriteReel.shortcode,
+            context: context,
+            provider: provider,
+            model: model
+        }, partial => {
+            outputDiv.textContent = partial;
+            placeholder.style.display = 'none';
+            resultDiv.style.display = 'flex';
         });
 
-        const data = await response.json();
-
         if (data.error) {
             throw new Error(data.error);
         }
@@ -1734,6 +1777,8 @@ async function generateQuickRewrite() {
 
     } catch (error) {
         alert(`Error: ${error.message}`);
+        resultDiv.style.display = 'none';
+        placeholder.style.display = 'flex';
         placeholder.innerHTML = `
             <div class="placeholder-icon">
                 <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
@@ -1749,6 +1794,56 @@ async function generateQuickRewrite() {
     }
 }
 
+// Identity of the last rewrite request. Generating again with the same reel,
+// context and model asks for a fresh variant instead of the cached one.
+let lastRewriteKey = null;
+
+// POST to /api/rewrite. Local (Ollama) rewrites are streamed back as
+// Server-Sent Events so text appears while the model is still generating.
+async function requestRewrite(payload, onPartial) {
+    const key = JSON.stringify([payload.scrape_id, payload.shortcode, payload.context, payload.provider, payload.model]);
+    const refresh = key === lastRewriteKey;
+    lastRewriteKey = key;
+
+    const response = await fetch('/api/rewrite', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...payload, refresh, stream: payload.provider === 'local' })
+    });
+
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!contentType.startsWith('text/event-stream') || !response.body) {
+        return response.json();
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let partial = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+
+        for (const event of events) {
+            if (!event.startsWith('data: ')) continue;
+            const data = JSON.parse(event.slice(6));
+            if (data.chunk) {
+                partial += data.chunk;
+                if (onPartial) onPartial(partial);
+            } else if (data.done || data.error) {
+                return data;
+            }
+        }
+    }
+
+    return { error: 'Rewrite stream ended unexpectedly' };
+}
+
 // Close rewrite modal
 function closeRewriteModal() {
     rewriteModal.classList.remove('active');
@@ -1786,20 +1881,18 @@ async function generateRewrite() {
     `;
 
     try {
-        const response = await fetch('/api/rewrite', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                scrape_id: currentRewriteReel.scrapeId,
-                shortcode: currentRewriteReel.shortcode,
-                context: context,
-                provider: provider,
-                model: model
-            })
+        const data = await requestRewrite({
+            scrape_id: currentRewriteReel.scrapeId,
+            shortcode: currentRewriteReel.shortcode,
+            context: context,
+            provider: provider,
+            model: model
+        }, partial => {
+            outputDiv.textContent = partial;
+            placeholder.style.display = 'none';
+            resultDiv.style.display = 'flex';
         });
 
-        const data = await response.json();
-
         if (data.error) {
             throw new Error(data.error);
         }
@@ -1811,6 +1904,8 @@ async function generateRewrite() {
     } catch (error) {
         alert(`Error: ${error.message}`);
         // Reset placeholder
+        resultDiv.style.display = 'none';
+        placeholder.style.display = 'flex';
         placeholder.innerHTML = `
             <div class="placeholder-icon">
                 <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
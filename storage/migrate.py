@@ -14,27 +14,28 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from storage.database import init_db
 from storage.models import Asset
+from utils.history_store import HistoryStore
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 OUTPUT_DIR = BASE_DIR / 'output'
 SKELETON_REPORTS_DIR = OUTPUT_DIR / 'skeleton_reports'
-SCRAPE_HISTORY_FILE = BASE_DIR / 'scrape_history.json'
+SCRAPE_HISTORY_FILE = BASE_DIR / 'scrape_history.json'  # legacy, split into HISTORY_DIR on first load
+HISTORY_DIR = BASE_DIR / 'history'
 
 
 def migrate_scrape_history():
-    """Import scrapes from scrape_history.json"""
+    """Import scrapes from the scrape history store"""
     print("\n--- Migrating Scrape History ---")
 
-    if not SCRAPE_HISTORY_FILE.exists():
-        print(f"  No scrape_history.json found at {SCRAPE_HISTORY_FILE}")
-        return 0
-
     try:
-        with open(SCRAPE_HISTORY_FILE, 'r') as f:
-            history = json.load(f)
+        history = HistoryStore(HISTORY_DIR, legacy_file=SCRAPE_HISTORY_FILE).load_all()
     except Exception as e:
-        print(f"  Error reading scrape_history.json: {e}")
+        print(f"  Error reading scrape history: {e}")
+        return 0
+
+    if not history:
+        print(f"  No scrape history found at {HISTORY_DIR}")
         return 0
 
     if not isinstance(history, list):
@@ -13,10 +13,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from storage.database import get_db_connection, db_transaction
 from storage.models import Asset
+from utils.history_store import HistoryStore
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
-SCRAPE_HISTORY_FILE = BASE_DIR / 'scrape_history.json'
+SCRAPE_HISTORY_FILE = BASE_DIR / 'scrape_history.json'  # legacy, split into HISTORY_DIR on first load
+HISTORY_DIR = BASE_DIR / 'history'
 
 
 def update_skeleton_assets():
@@ -95,15 +97,14 @@ def update_scrape_assets():
     print("\n--- Updating Scrape Assets ---")
 
     # Load scrape history
-    if not SCRAPE_HISTORY_FILE.exists():
-        print(f"  No scrape_history.json found")
-        return 0
-
     try:
-        with open(SCRAPE_HISTORY_FILE, 'r') as f:
-            history = json.load(f)
+        history = HistoryStore(HISTORY_DIR, legacy_file=SCRAPE_HISTORY_FILE).load_all()
     except Exception as e:
-        print(f"  Error reading scrape_history.json: {e}")
+        print(f"  Error reading scrape history: {e}")
+        return 0
+
+    if not history:
+        print(f"  No scrape history found")
         return 0
 
     # Get all scrape-type assets
@@ -0,0 +1,246 @@
+"""
+Test script for app.py endpoints - runs against temporary output, history and
+cache directories via the Flask test client.
+Run: python test_app.py
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add this directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as app_module
+from utils.history_store import HistoryStore
+from utils.rewrite_cache import RewriteCache
+
+
+@contextmanager
+def isolated_app():
+    """Point the app's output dirs, config, history and rewrite cache at a temp dir"""
+    saved = {name: getattr(app_module, name) for name in (
+        'OUTPUT_DIR', 'TIKTOK_OUTPUT_DIR', 'CONFIG_FILE', 'history_store', 'rewrite_cache')}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / 'output').mkdir()
+        (tmp / 'output_tiktok').mkdir()
+        app_module.OUTPUT_DIR = tmp / 'output'
+        app_module.TIKTOK_OUTPUT_DIR = tmp / 'output_tiktok'
+        app_module.CONFIG_FILE = tmp / 'config.json'
+        app_module.history_store = HistoryStore(tmp / 'history')
+        app_module.rewrite_cache = RewriteCache(tmp / 'rewrite_cache.db')
+        with app_module._history_lock:
+            app_module._history_index = None
+            app_module._history_by_id.clear()
+            app_module._history_dirty.clear()
+            app_module._history_deleted.clear()
+        try:
+            yield app_module.app.test_client(), tmp
+        finally:
+            app_module.flush_history()
+            with app_module._history_lock:
+                app_module._history_index = None
+                app_module._history_by_id.clear()
+            for name, value in saved.items():
+                setattr(app_module, name, value)
+
+
+def add_scrape(scrape_id='scrape1', shortcode='ABC123'):
+    app_module.add_to_history({
+        'id': scrape_id,
+        'username': 'testuser',
+        'status': 'complete',
+        'top_reels': [{'shortcode': shortcode, 'views': 1000, 'transcript': 'hello world'}]
+    })
+
+
+def sse_events(response):
+    """Decode the data frames of an SSE response"""
+    body = response.get_data(as_text=True)
+    return [app_module.json_loads(frame[len('data: '):])
+            for frame in body.split('\n\n') if frame.startswith('data: ')]
+
+
+def test_status_etag():
+    """Unchanged scrape status answers If-None-Match with 304"""
+    print("Testing scrape status ETag...")
+    with isolated_app() as (client, _):
+        with app_module._SCRAPES_LOCK:
+            app_module.active_scrapes['etag-test'] = {
+                'status': 'running', 'progress': 'Working', 'result': None, 'version': 1}
+        try:
+            first = client.get('/api/scrape/etag-test/status')
+            assert first.status_code == 200
+            etag = first.headers['ETag']
+
+            again = client.get('/api/scrape/etag-test/status', headers={'If-None-Match': etag})
+            assert again.status_code == 304
+
+            app_module._notify_scrape_update('etag-test')
+            changed = client.get('/api/scrape/etag-test/status', headers={'If-None-Match': etag})
+            assert changed.status_code == 200
+            assert changed.headers['ETag'] != etag
+        finally:
+            with app_module._SCRAPES_LOCK:
+                app_module.active_scrapes.pop('etag-test', None)
+    print("  PASS")
+
+
+def test_scrape_events_stream():
+    """A finished scrape's SSE stream sends the result once and ends"""
+    print("\nTesting scrape events stream...")
+    with isolated_app() as (client, _):
+        with app_module._SCRAPES_LOCK:
+            app_module.active_scrapes['sse-test'] = {
+                'status': 'complete', 'progress': 'Done', 'result': {'top_reels': []}, 'version': 2}
+        try:
+            response = client.get('/api/scrape/sse-test/events')
+            assert response.mimetype == 'text/event-stream'
+            events = sse_events(response)
+            assert len(events) == 1
+            assert events[0]['status'] == 'complete'
+            assert events[0]['result'] == {'top_reels': []}
+        finally:
+            with app_module._SCRAPES_LOCK:
+                app_module.active_scrapes.pop('sse-test', None)
+    print("  PASS")
+
+
+def test_rewrite_stream():
+    """Streamed local rewrites emit chunks, then a done event, then serve from cache"""
+    print("\nTesting rewrite stream...")
+    original = app_module.stream_ollama
+    app_module.stream_ollama = lambda prompt, model: iter(['Hel', 'lo'])
+    try:
+        with isolated_app() as (client, _):
+            add_scrape()
+            payload = {'scrape_id': 'scrape1', 'shortcode': 'ABC123',
+                       'provider': 'local', 'model': 'test-model', 'stream': True}
+
+            response = client.post('/api/rewrite', json=payload)
+            assert response.mimetype == 'text/event-stream'
+            events = sse_events(response)
+            assert [e['chunk'] for e in events if 'chunk' in e] == ['Hel', 'lo']
+            assert events[-1]['done'] and events[-1]['result'] == 'Hello'
+
+            cached = client.post('/api/rewrite', json=payload)
+            assert cached.get_json() == {'result': 'Hello', 'provider': 'local',
+                                         'model': 'test-model', 'cached': True}
+    finally:
+        app_module.stream_ollama = original
+    print("  PASS")
+
+
+def test_rewrite_refresh():
+    """Repeat rewrites are cache hits; refresh goes back to the provider"""
+    print("\nTesting rewrite cache refresh...")
+    calls = []
+
+    def fake_call_provider(provider, prompt, model, api_key=None):
+        calls.append(prompt)
+        return f"Rewrite {len(calls)}"
+
+    original = app_module.call_provider
+    app_module.call_provider = fake_call_provider
+    try:
+        with isolated_app() as (client, _):
+            add_scrape()
+            payload = {'scrape_id': 'scrape1', 'shortcode': 'ABC123',
+                       'provider': 'local', 'model': 'test-model'}
+
+            first = client.post('/api/rewrite', json=payload).get_json()
+            assert first['result'] == 'Rewrite 1' and not first['cached']
+
+            second = client.post('/api/rewrite', json=payload).get_json()
+            assert second['result'] == 'Rewrite 1' and second['cached']
+
+            fresh = client.post('/api/rewrite', json=dict(payload, refresh=True)).get_json()
+            assert fresh['result'] == 'Rewrite 2' and not fresh['cached']
+            assert len(calls) == 2
+    finally:
+        app_module.call_provider = original
+    print("  PASS")
+
+
+def test_history_delete():
+    """Deleting an unknown scrape is a 404; a known one is removed"""
+    print("\nTesting history delete...")
+    with isolated_app() as (client, _):
+        assert client.delete('/api/history/missing').status_code == 404
+
+        add_scrape()
+        assert client.delete('/api/history/scrape1').status_code == 200
+        assert client.get('/api/history').get_json() == []
+        assert client.delete('/api/history/scrape1').status_code == 404
+    print("  PASS")
+
+
+def test_videos_limit():
+    """limit must be an integer; it caps the list while total counts every match"""
+    print("\nTesting video list limit...")
+    with isolated_app() as (client, tmp):
+        videos_dir = tmp / 'output' / 'output_testuser' / 'videos'
+        videos_dir.mkdir(parents=True)
+        for name in ('one.mp4', 'two.mp4'):
+            (videos_dir / name).write_bytes(b'video')
+
+        assert client.get('/api/videos?limit=abc').status_code == 400
+
+        limited = client.get('/api/videos?limit=1').get_json()
+        assert len(limited['videos']) == 1
+        assert limited['total'] == 2
+
+        everything = client.get('/api/videos').get_json()
+        assert len(everything['videos']) == 2
+    print("  PASS")
+
+
+def test_video_symlinks():
+    """Symlinked videos are neither streamed nor deleted"""
+    print("\nTesting video symlink rejection...")
+    with isolated_app() as (client, tmp):
+        videos_dir = tmp / 'output' / 'output_testuser' / 'videos'
+        videos_dir.mkdir(parents=True)
+        (videos_dir / 'real.mp4').write_bytes(b'video')
+        link = videos_dir / 'link.mp4'
+        try:
+            link.symlink_to(videos_dir / 'real.mp4')
+        except OSError:
+            print("  SKIP (symlinks not supported)")
+            return
+
+        response = client.get('/api/videos/stream/testuser/real.mp4')
+        assert response.status_code == 200
+        response.close()
+        assert client.get('/api/videos/stream/testuser/link.mp4').status_code == 403
+
+        response = client.post('/api/videos/delete', json={'path': str(link)})
+        assert response.status_code == 403
+        assert os.path.lexists(link)
+    print("  PASS")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 50)
+    print("APP ENDPOINT TESTS")
+    print("=" * 50)
+
+    test_status_etag()
+    test_scrape_events_stream()
+    test_rewrite_stream()
+    test_rewrite_refresh()
+    test_history_delete()
+    test_videos_limit()
+    test_video_symlinks()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -7,10 +7,16 @@ from .logger import get_logger, LogLevel
 from .state_manager import ScrapeStateManager, ScrapeState, ScrapePhase
 from .retry import retry_with_backoff, RetryConfig
 from .updater import check_for_updates, run_update, get_current_version, get_git_status
+from .fast_json import json_dumps, json_loads, ORJSON_AVAILABLE
+from .history_store import HistoryStore, summarize_entry
+from .atomic_write import atomic_write_bytes
 
 __all__ = [
     'get_logger', 'LogLevel',
     'ScrapeStateManager', 'ScrapeState', 'ScrapePhase',
     'retry_with_backoff', 'RetryConfig',
-    'check_for_updates', 'run_update', 'get_current_version', 'get_git_status'
+    'check_for_updates', 'run_update', 'get_current_version', 'get_git_status',
+    'json_dumps', 'json_loads', 'ORJSON_AVAILABLE',
+    'HistoryStore', 'summarize_entry',
+    'atomic_write_bytes'
 ]
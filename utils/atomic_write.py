@@ -0,0 +1,31 @@
+"""
+ReelRecon - Atomic File Writes
+Write to a sibling temp file, then os.replace() it over the target so readers
+never see a torn file. fsync is skipped by default - everything written this
+way is re-derivable from memory - set SYNC=1 to force it.
+"""
+
+import os
+from pathlib import Path
+from typing import Union
+
+SYNC_WRITES = os.environ.get('SYNC', '') == '1'
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes, sync: bool = SYNC_WRITES):
+    """Atomically replace path with data. Raises on failure, leaving path untouched."""
+    path = Path(path)
+    temp_file = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except BaseException:
+        try:
+            temp_file.unlink()
+        except FileNotFoundError:
+            pass
+        raise
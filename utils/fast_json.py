@@ -0,0 +1,33 @@
+"""
+ReelRecon - Fast JSON Serialization
+Uses orjson when installed, falls back to the stdlib json module
+"""
+
+import json
+from typing import Any, Union
+
+# Optional: orjson (C/Rust implementation, several times faster than stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
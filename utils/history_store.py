@@ -0,0 +1,165 @@
+"""
+ReelRecon - Scrape History Store
+Per-scrape history files plus a lightweight index:
+
+    history/index.json      - [{id, username, timestamp, top_count, ...}, ...] newest first
+    history/<scrape_id>.json - full entry including top_reels and transcripts
+                               (<scrape_id>.json.gz once it exceeds GZIP_THRESHOLD)
+
+Mutations touch one small scrape file and the index instead of rewriting the
+whole history blob. The legacy monolithic scrape_history.json is split into
+this layout on first use.
+"""
+
+import re
+import gzip
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from .fast_json import json_dumps, json_loads
+from .atomic_write import atomic_write_bytes
+from .logger import get_logger
+
+logger = get_logger()
+
+# Fields copied from a full entry into the index
+INDEX_FIELDS = ('id', 'username', 'timestamp', 'top_count', 'total_reels', 'platform', 'status')
+
+# Transcript-heavy entries compress 3-5x; level 1 keeps writes cheap
+GZIP_THRESHOLD = 16 * 1024  # bytes of serialized JSON
+GZIP_LEVEL = 1
+
+_SAFE_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+def summarize_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Index record for a full history entry"""
+    return {field: entry.get(field) for field in INDEX_FIELDS}
+
+
+class HistoryStore:
+    """
+    File-per-scrape history persistence.
+    Not thread-safe on its own - callers serialize access (app.py holds _history_lock).
+    """
+
+    def __init__(self, history_dir: Path, legacy_file: Optional[Path] = None):
+        self.history_dir = Path(history_dir)
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.history_dir / "index.json"
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+
+        self.migrate_legacy()
+
+    def _scrape_path(self, scrape_id: str) -> Optional[Path]:
+        """Path of a scrape file, or None for IDs that aren't safe file names"""
+        if not scrape_id or not _SAFE_ID_RE.match(scrape_id):
+            return None
+        return self.history_dir / f"{scrape_id}.json"
+
+    def _paths(self, scrape_id: str):
+        """(json_path, gz_path) for a scrape, or (None, None) for unsafe IDs"""
+        path = self._scrape_path(scrape_id)
+        if path is None:
+            return None, None
+        return path, path.with_name(path.name + '.gz')
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write via temp file + rename so readers never see a partial file"""
+        try:
+            atomic_write_bytes(path, data)
+        except Exception as e:
+            logger.error("HISTORY", f"Failed to write {path.name}", exception=e)
+
+    def migrate_legacy(self) -> int:
+        """
+        Split a monolithic scrape_history.json into per-scrape files.
+        The legacy file is renamed to *.migrated afterwards. Returns entries migrated.
+        """
+        if not self.legacy_file or not self.legacy_file.exists() or self.index_file.exists():
+            return 0
+
+        try:
+            history = json_loads(self.legacy_file.read_bytes())
+        except Exception as e:
+            logger.error("HISTORY", "Failed to read legacy history", exception=e)
+            return 0
+        if not isinstance(history, list):
+            return 0
+
+        index = []
+        for entry in history:
+            if self._scrape_path(entry.get('id')) is None:
+                continue
+            self.write_scrape(entry)
+            index.append(summarize_entry(entry))
+        self.write_index(index)
+
+        self.legacy_file.replace(self.legacy_file.with_suffix('.json.migrated'))
+        logger.info("HISTORY", f"Migrated {len(index)} scrapes to {self.history_dir}")
+        return len(index)
+
+    def load_index(self) -> List[Dict[str, Any]]:
+        """Read the index (newest first)"""
+        try:
+            index = json_loads(self.index_file.read_bytes())
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.error("HISTORY", "Failed to read index", exception=e)
+            return []
+        return index if isinstance(index, list) else []
+
+    def write_index(self, index: List[Dict[str, Any]]):
+        self._write_atomic(self.index_file, json_dumps(index))
+
+    def load_scrape(self, scrape_id: str) -> Optional[Dict[str, Any]]:
+        """Read one full scrape entry"""
+        path, gz_path = self._paths(scrape_id)
+        if path is None:
+            return None
+        try:
+            try:
+                return json_loads(gzip.decompress(gz_path.read_bytes()))
+            except FileNotFoundError:
+                # Small entries (or hand-edited ones) are plain JSON
+                return json_loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error("HISTORY", f"Failed to read scrape {scrape_id}", exception=e)
+            return None
+
+    def write_scrape(self, entry: Dict[str, Any]):
+        path, gz_path = self._paths(entry.get('id'))
+        if path is None:
+            return
+        data = json_dumps(entry)
+        if len(data) > GZIP_THRESHOLD:
+            self._write_atomic(gz_path, gzip.compress(data, compresslevel=GZIP_LEVEL))
+            stale = path
+        else:
+            self._write_atomic(path, data)
+            stale = gz_path
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+
+    def delete_scrape(self, scrape_id: str):
+        for path in self._paths(scrape_id):
+            if path is None:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Full entries in index order, skipping any whose file is missing"""
+        entries = []
+        for item in self.load_index():
+            entry = self.load_scrape(item.get('id'))
+            if entry is not None:
+                entries.append(entry)
+        return entries
@@ -1,12 +1,16 @@
 """
 ReelRecon - Comprehensive Logging System
-Logs to both console and file with structured error tracking
+Logs to both console and file with structured error tracking.
+Callers only format and enqueue; one background thread does the console and
+file I/O in batches, so scrape/worker threads never contend on stdout or disk.
 """
 
 import os
 import sys
 import time
 import json
+import queue
+import atexit
 import hashlib
 import traceback
 from datetime import datetime
@@ -24,6 +28,20 @@ class LogLevel(Enum):
     CRITICAL = 50
 
 
+# Level colors for console output
+LEVEL_COLORS = {
+    LogLevel.DEBUG: "\033[90m",    # Gray
+    LogLevel.INFO: "\033[0m",      # Default
+    LogLevel.WARNING: "\033[93m",  # Yellow
+    LogLevel.ERROR: "\033[91m",    # Red
+    LogLevel.CRITICAL: "\033[95m"  # Magenta
+}
+COLOR_RESET = "\033[0m"
+
+# Max seconds flush() waits for the writer thread (e.g. at exit)
+FLUSH_TIMEOUT = 5.0
+
+
 class ReelReconLogger:
     """Thread-safe logger with file rotation and structured error codes"""
 
@@ -57,6 +75,13 @@ class ReelReconLogger:
         self.error_registry: Dict[str, Dict[str, Any]] = {}
         self._file_lock = threading.Lock()
 
+        # (level, console line, file entry) records, or an Event to set once
+        # everything queued before it has been written
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
         # Write startup message
         self._write_log(LogLevel.INFO, "SYSTEM", "Logger initialized", {
             "log_dir": str(self.log_dir),
@@ -113,44 +138,71 @@ class ReelReconLogger:
 
     def _write_log(self, level: LogLevel, category: str, message: str,
                    data: Optional[Dict] = None, error_code: Optional[str] = None):
-        """Write log entry to file and console"""
+        """Queue log entry for the console and file"""
         if level.value < self.min_level.value:
             return
 
+        # Format here so the entry reflects data as it was at call time
         log_entry = self._format_log_entry(level, category, message, data, error_code)
 
         # Console output (simplified)
-        level_colors = {
-            LogLevel.DEBUG: "\033[90m",    # Gray
-            LogLevel.INFO: "\033[0m",      # Default
-            LogLevel.WARNING: "\033[93m",  # Yellow
-            LogLevel.ERROR: "\033[91m",    # Red
-            LogLevel.CRITICAL: "\033[95m"  # Magenta
-        }
-        reset = "\033[0m"
-        color = level_colors.get(level, "")
-
         console_msg = f"[{category}] {message}"
         if error_code:
             console_msg = f"[{error_code}] {message}"
 
-        print(f"{color}{console_msg}{reset}")
+        self._queue.put((level, f"{LEVEL_COLORS.get(level, '')}{console_msg}{COLOR_RESET}\n", log_entry + "\n"))
+
+    def _writer_loop(self):
+        """Drain the queue, writing whatever has accumulated in one pass"""
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            records = [item for item in batch if isinstance(item, tuple)]
+            if records:
+                self._write_batch(records)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write_batch(self, records):
+        """Write queued records to console and file"""
+        stdout = sys.stdout
+        if stdout is not None:  # None under windowed builds
+            try:
+                stdout.write(''.join(line for _, line, _ in records))
+                stdout.flush()
+            except Exception:
+                pass
+
+        entries = ''.join(entry for _, _, entry in records)
+        errors = ''.join(entry for level, _, entry in records if level.value >= LogLevel.ERROR.value)
 
         # File output
         with self._file_lock:
             try:
                 self._rotate_if_needed(self.current_log_file)
                 with open(self.current_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_entry + "\n")
+                    f.write(entries)
 
                 # Also write errors to separate error log
-                if level.value >= LogLevel.ERROR.value:
+                if errors:
                     self._rotate_if_needed(self.error_log_file)
                     with open(self.error_log_file, 'a', encoding='utf-8') as f:
-                        f.write(log_entry + "\n")
+                        f.write(errors)
             except Exception as e:
                 print(f"[LOGGER ERROR] Failed to write log: {e}", file=sys.stderr)
 
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Block until everything logged so far is written. Returns False on timeout."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
     def debug(self, category: str, message: str, data: Optional[Dict] = None):
         """Log debug message"""
         self._write_log(LogLevel.DEBUG, category, message, data)
@@ -0,0 +1,92 @@
+"""
+ReelRecon - Adaptive Rate Limiting
+Thread-safe token bucket that paces requests to one API. The refill rate
+creeps up while responses succeed and is halved (with a pause) on HTTP 429,
+so callers run as fast as the server tolerates instead of sleeping a fixed
+amount between every request.
+"""
+
+import time
+import threading
+from typing import Optional
+
+from .logger import get_logger
+
+logger = get_logger()
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket with additive-increase / multiplicative-decrease on the rate.
+
+    Usage:
+        limiter = AdaptiveRateLimiter(rate=1.0, max_rate=2.0)
+
+        limiter.acquire()
+        resp = session.get(url)
+        if resp.status_code == 429:
+            limiter.throttled(resp.headers.get('Retry-After'))
+        else:
+            limiter.succeeded()
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 2, min_rate: float = 0.1,
+                 max_rate: float = 2.0, increase: float = 0.05, max_pause: float = 60.0,
+                 name: str = "API"):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.max_pause = max_pause
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._strikes = 0  # consecutive 429s, drives the pause length
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def succeeded(self):
+        """Record a successful response; slowly raise the rate toward max_rate"""
+        with self._lock:
+            self._strikes = 0
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self, retry_after: Optional[str] = None) -> float:
+        """
+        Record an HTTP 429. Halves the rate and pauses all callers for
+        Retry-After seconds when given, else exponential backoff. Returns the pause.
+        """
+        with self._lock:
+            self._strikes += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            try:
+                pause = float(retry_after)
+            except (TypeError, ValueError):
+                pause = 2.0 ** self._strikes
+            pause = min(max(pause, 0.0), self.max_pause)
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = 0.0
+
+        logger.warning(self.name, f"Rate limited - pausing {pause:.1f}s, rate now {self.rate:.2f} req/s")
+        return pause
@@ -0,0 +1,290 @@
+"""
+ReelRecon - LLM Rewrite Response Cache
+Two-tier cache in front of the AI rewrite providers:
+
+1. Exact: blake2b(provider + model + prompt) -> response, held in an
+   in-memory LRU and persisted to SQLite so hits survive restarts.
+2. Semantic: hashed bag-of-words embeddings of the prompt parts
+   (transcript, user context). A miss on the exact tier returns a cached
+   response when every part is near-identical (cosine >= threshold) for
+   the same provider/model and scope - callers pass the reel as the scope,
+   so one reel's rewrite is never served for another with a similar transcript.
+"""
+
+import re
+import math
+import sqlite3
+import hashlib
+import importlib.util
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Sequence, List, Set, Tuple
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Optional: numpy for vectorized similarity lookups (imported on first lookup)
+try:
+    NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+except (ImportError, ValueError):
+    NUMPY_AVAILABLE = False
+
+EMBEDDING_DIM = 256
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS rewrite_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT '',
+    response TEXT NOT NULL,
+    embedding BLOB,
+    created_at REAL DEFAULT (strftime('%s', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_rewrite_cache_created_at ON rewrite_cache(created_at);
+"""
+
+
+def embed_text(text: str) -> List[float]:
+    """
+    Zero-dependency text embedding: unigram + bigram feature hashing into a
+    fixed-size, L2-normalized vector. Text without tokens embeds to a fixed
+    unit vector, so two empty parts (e.g. no user context) still match.
+    """
+    vec = [0.0] * EMBEDDING_DIM
+    tokens = _TOKEN_RE.findall((text or '').lower())
+    if not tokens:
+        vec[0] = 1.0
+        return vec
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+        idx = int.from_bytes(digest[:4], 'little') % EMBEDDING_DIM
+        sign = 1.0 if digest[4] & 1 else -1.0
+        vec[idx] += sign
+
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm:
+        vec = [v / norm for v in vec]
+    return vec
+
+
+class RewriteCache:
+    """
+    Exact + semantic cache for LLM rewrite responses.
+
+    Usage:
+        cache = RewriteCache(BASE_DIR / "state" / "rewrite_cache.db")
+
+        response = cache.get('openai', 'gpt-4o-mini', prompt, parts=(transcript, context), scope=shortcode)
+        if response is None:
+            response = call_openai(prompt, model, key)
+            cache.set('openai', 'gpt-4o-mini', prompt, response, parts=(transcript, context), scope=shortcode)
+    """
+
+    def __init__(self, db_path: Path, max_memory_entries: int = 256,
+                 max_db_entries: int = 5000, similarity_threshold: float = 0.95):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+        self.max_db_entries = max_db_entries
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.RLock()
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+
+        # Semantic index: parallel lists of (provider, model, scope), key, and
+        # the concatenated per-part embeddings; the set mirrors the key list
+        self._semantic_scope: List[Tuple[str, str, str]] = []
+        self._semantic_keys: List[str] = []
+        self._semantic_key_set: Set[str] = set()
+        self._semantic_vectors: List[array] = []
+        self._semantic_matrix = None  # numpy cache of _semantic_vectors
+
+        self._init_db()
+        self._load_semantic_index()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str) -> str:
+        """Exact-match cache key"""
+        h = hashlib.blake2b(digest_size=20)
+        for part in (provider, model, prompt):
+            h.update((part or '').encode('utf-8'))
+            h.update(b'\x00')
+        return h.hexdigest()
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection that commits on success and always closes"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        try:
+            with self._connect() as conn:
+                conn.executescript(SCHEMA_SQL)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(rewrite_cache)")}
+                if 'scope' not in columns:
+                    conn.execute("ALTER TABLE rewrite_cache ADD COLUMN scope TEXT NOT NULL DEFAULT ''")
+        except Exception as e:
+            logger.warning("CACHE", f"Rewrite cache database init failed: {e}")
+
+    def _load_semantic_index(self):
+        """Load stored embeddings so semantic hits survive restarts"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT key, provider, model, scope, embedding FROM rewrite_cache "
+                    "WHERE embedding IS NOT NULL ORDER BY created_at"
+                ).fetchall()
+        except Exception as e:
+            logger.warning("CACHE", f"Failed to load rewrite cache index: {e}")
+            return
+
+        for key, provider, model, scope, blob in rows:
+            vec = array('f')
+            vec.frombytes(blob)
+            self._add_semantic(key, (provider, model, scope), vec)
+
+    def _add_semantic(self, key: str, scope: Tuple[str, str, str], vec: array):
+        self._semantic_scope.append(scope)
+        self._semantic_keys.append(key)
+        self._semantic_key_set.add(key)
+        self._semantic_vectors.append(vec)
+        self._semantic_matrix = None
+
+    def _embed_parts(self, parts: Sequence[str]) -> array:
+        vec = array('f')
+        for part in parts:
+            vec.extend(embed_text(part))
+        return vec
+
+    def _remember(self, key: str, response: str):
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup_exact(self, key: str) -> Optional[str]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response FROM rewrite_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.warning("CACHE", f"Rewrite cache read failed: {e}")
+            return None
+
+        if row:
+            self._remember(key, row[0])
+            return row[0]
+        return None
+
+    def _lookup_semantic(self, scope: Tuple[str, str, str], parts: Sequence[str]) -> Optional[str]:
+        if not self._semantic_vectors:
+            return None
+
+        query = self._embed_parts(parts)
+        n_parts = len(parts)
+        best_key = None
+
+        if NUMPY_AVAILABLE:
+            import numpy as np
+            if self._semantic_matrix is None:
+                try:
+                    self._semantic_matrix = np.array(self._semantic_vectors, dtype=np.float32)
+                except ValueError:
+                    # Mixed part counts can't form one matrix
+                    return None
+            matrix = self._semantic_matrix
+            if matrix.ndim != 2 or matrix.shape[1] != len(query):
+                return None
+            q = np.frombuffer(query, dtype=np.float32)
+            # Per-part cosine similarity; a candidate must match on every part
+            sims = (matrix * q).reshape(len(matrix), n_parts, EMBEDDING_DIM).sum(axis=2)
+            scores = sims.min(axis=1)
+            for idx in np.argsort(-scores):
+                if scores[idx] < self.similarity_threshold:
+                    break
+                if self._semantic_scope[idx] == scope:
+                    best_key = self._semantic_keys[idx]
+                    break
+        else:
+            best_score = self.similarity_threshold
+            for idx, vec in enumerate(self._semantic_vectors):
+                if self._semantic_scope[idx] != scope or len(vec) != len(query):
+                    continue
+                score = min(
+                    sum(vec[i] * query[i] for i in range(p * EMBEDDING_DIM, (p + 1) * EMBEDDING_DIM))
+                    for p in range(n_parts)
+                )
+                if score >= best_score:
+                    best_score = score
+                    best_key = self._semantic_keys[idx]
+
+        return self._lookup_exact(best_key) if best_key else None
+
+    def get(self, provider: str, model: str, prompt: str,
+            parts: Sequence[str] = (), scope: str = '') -> Optional[str]:
+        """Return a cached response, trying the exact tier then the semantic tier"""
+        key = self.make_key(provider, model, prompt)
+        with self._lock:
+            response = self._lookup_exact(key)
+            if response is not None:
+                logger.debug("CACHE", f"Rewrite cache HIT (exact): {provider}/{model}")
+                return response
+
+            if parts:
+                response = self._lookup_semantic((provider, model, scope), parts)
+                if response is not None:
+                    logger.debug("CACHE", f"Rewrite cache HIT (semantic): {provider}/{model}")
+                    return response
+
+        logger.debug("CACHE", f"Rewrite cache MISS: {provider}/{model}")
+        return None
+
+    def set(self, provider: str, model: str, prompt: str, response: str,
+            parts: Sequence[str] = (), scope: str = ''):
+        """Store a successful response in both tiers"""
+        if not response:
+            return
+
+        key = self.make_key(provider, model, prompt)
+        vec = self._embed_parts(parts) if parts else None
+
+        with self._lock:
+            self._remember(key, response)
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO rewrite_cache (key, provider, model, scope, response, embedding) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, provider, model, scope, response, vec.tobytes() if vec is not None else None)
+                    )
+                    conn.execute(
+                        "DELETE FROM rewrite_cache WHERE key NOT IN "
+                        "(SELECT key FROM rewrite_cache ORDER BY created_at DESC LIMIT ?)",
+                        (self.max_db_entries,)
+                    )
+            except Exception as e:
+                logger.warning("CACHE", f"Rewrite cache write failed: {e}")
+
+            if vec is not None and key not in self._semantic_key_set:
+                self._add_semantic(key, (provider, model, scope), vec)
+                if len(self._semantic_keys) > self.max_db_entries:
+                    self._semantic_key_set.discard(self._semantic_keys[0])
+                    del self._semantic_scope[0], self._semantic_keys[0], self._semantic_vectors[0]
+                    self._semantic_matrix = None
@@ -154,8 +154,9 @@ class ScrapeStateManager:
                 'jobs': [job.to_dict() for job in self._jobs.values()]
             }
 
+            # Compact: this runs on every progress update
             with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
 
             # Atomic rename
             temp_file.replace(self.state_file)
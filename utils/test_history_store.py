@@ -0,0 +1,109 @@
+"""
+Test script for the scrape history store - validates legacy migration,
+gzip storage and deletes.
+Run: python -m utils.test_history_store
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.fast_json import json_dumps, json_loads
+from utils.history_store import HistoryStore, GZIP_THRESHOLD
+
+
+def make_entry(scrape_id, transcript='short'):
+    return {
+        'id': scrape_id,
+        'username': 'testuser',
+        'timestamp': '2024-01-01T00:00:00',
+        'top_count': 1,
+        'status': 'complete',
+        'top_reels': [{'shortcode': 'ABC123', 'transcript': transcript}]
+    }
+
+
+def test_legacy_migration():
+    """Test splitting a monolithic scrape_history.json into per-scrape files."""
+    print("Testing legacy migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        legacy = tmp / 'scrape_history.json'
+        legacy.write_bytes(json_dumps([make_entry('new'), make_entry('old'), make_entry('../bad')]))
+
+        store = HistoryStore(tmp / 'history', legacy_file=legacy)
+
+        assert [item['id'] for item in store.load_index()] == ['new', 'old']
+        assert store.load_scrape('old')['top_reels'][0]['shortcode'] == 'ABC123'
+        assert store.load_scrape('../bad') is None
+        assert not legacy.exists()
+        assert (tmp / 'scrape_history.json.migrated').exists()
+
+        # A second start must not migrate again
+        assert store.migrate_legacy() == 0
+    print("  PASS")
+
+
+def test_gzip_storage():
+    """Test that large entries are gzipped and small ones stay plain JSON."""
+    print("\nTesting gzip storage...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(Path(tmp))
+
+        store.write_scrape(make_entry('small'))
+        assert (Path(tmp) / 'small.json').exists()
+        assert not (Path(tmp) / 'small.json.gz').exists()
+
+        large = make_entry('large', transcript='word ' * GZIP_THRESHOLD)
+        store.write_scrape(large)
+        gz_path = Path(tmp) / 'large.json.gz'
+        assert gz_path.exists()
+        assert not (Path(tmp) / 'large.json').exists()
+        assert gz_path.stat().st_size < GZIP_THRESHOLD
+        assert store.load_scrape('large') == large
+
+        # Shrinking below the threshold replaces the .gz with plain JSON
+        store.write_scrape(make_entry('large'))
+        assert not gz_path.exists()
+        assert json_loads((Path(tmp) / 'large.json').read_bytes())['top_reels'][0]['transcript'] == 'short'
+    print("  PASS")
+
+
+def test_delete_scrape():
+    """Test deleting plain and gzipped scrape files."""
+    print("\nTesting scrape delete...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(Path(tmp))
+        store.write_scrape(make_entry('small'))
+        store.write_scrape(make_entry('large', transcript='word ' * GZIP_THRESHOLD))
+
+        store.delete_scrape('small')
+        store.delete_scrape('large')
+        store.delete_scrape('missing')
+
+        assert store.load_scrape('small') is None
+        assert store.load_scrape('large') is None
+    print("  PASS")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 50)
+    print("HISTORY STORE TESTS")
+    print("=" * 50)
+
+    test_legacy_migration()
+    test_gzip_storage()
+    test_delete_scrape()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()
@@ -0,0 +1,127 @@
+"""
+Test script for the LLM rewrite cache - validates exact and semantic hits,
+scope isolation, overwrites and persistence.
+Run: python -m utils.test_rewrite_cache
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rewrite_cache import RewriteCache
+
+TRANSCRIPT = "stop scrolling if you want to grow your page this is the one trick nobody tells you"
+
+
+def test_exact_hit_and_miss():
+    """Test exact-tier hits, misses and overwrites."""
+    print("Testing exact hit/miss...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RewriteCache(Path(tmp) / 'cache.db')
+
+        assert cache.get('openai', 'gpt-4o-mini', 'prompt') is None
+        cache.set('openai', 'gpt-4o-mini', 'prompt', 'R1')
+        assert cache.get('openai', 'gpt-4o-mini', 'prompt') == 'R1'
+        assert cache.get('openai', 'gpt-4o', 'prompt') is None
+        assert cache.get('anthropic', 'gpt-4o-mini', 'prompt') is None
+
+        # Empty responses are never stored
+        cache.set('openai', 'gpt-4o-mini', 'other', '')
+        assert cache.get('openai', 'gpt-4o-mini', 'other') is None
+
+        # A refreshed rewrite replaces the cached one
+        cache.set('openai', 'gpt-4o-mini', 'prompt', 'R2')
+        assert cache.get('openai', 'gpt-4o-mini', 'prompt') == 'R2'
+    print("  PASS")
+
+
+def test_semantic_scope():
+    """Test semantic hits stay within the same reel scope."""
+    print("\nTesting semantic scope...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RewriteCache(Path(tmp) / 'cache.db')
+        cache.set('local', 'llama3', 'prompt v1', 'R1', parts=(TRANSCRIPT, ''), scope='ABC123')
+
+        # Different prompt text, same transcript and context: semantic hit
+        assert cache.get('local', 'llama3', 'prompt v2', parts=(TRANSCRIPT, ''), scope='ABC123') == 'R1'
+        # Same transcript on another reel, or different context: miss
+        assert cache.get('local', 'llama3', 'prompt v2', parts=(TRANSCRIPT, ''), scope='XYZ789') is None
+        assert cache.get('local', 'llama3', 'prompt v2', parts=(TRANSCRIPT, 'make it funny'),
+                         scope='ABC123') is None
+        assert cache.get('openai', 'llama3', 'prompt v2', parts=(TRANSCRIPT, ''), scope='ABC123') is None
+    print("  PASS")
+
+
+def test_persistence():
+    """Test both tiers survive a restart."""
+    print("\nTesting persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'cache.db'
+        RewriteCache(db_path).set('local', 'llama3', 'prompt v1', 'R1', parts=(TRANSCRIPT, ''), scope='ABC123')
+
+        cache = RewriteCache(db_path)
+        assert cache.get('local', 'llama3', 'prompt v1') == 'R1'
+        assert cache.get('local', 'llama3', 'prompt v2', parts=(TRANSCRIPT, ''), scope='ABC123') == 'R1'
+    print("  PASS")
+
+
+def test_scope_migration():
+    """Test databases created before the scope column are upgraded."""
+    print("\nTesting scope column migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'cache.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE rewrite_cache (key TEXT PRIMARY KEY, provider TEXT NOT NULL, "
+            "model TEXT NOT NULL, response TEXT NOT NULL, embedding BLOB, "
+            "created_at REAL DEFAULT (strftime('%s', 'now')))"
+        )
+        conn.commit()
+        conn.close()
+
+        cache = RewriteCache(db_path)
+        cache.set('local', 'llama3', 'prompt', 'R1', parts=(TRANSCRIPT, ''), scope='ABC123')
+        assert cache.get('local', 'llama3', 'prompt') == 'R1'
+    print("  PASS")
+
+
+def test_eviction():
+    """Test the database and semantic index stay within max_db_entries."""
+    print("\nTesting eviction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RewriteCache(Path(tmp) / 'cache.db', max_db_entries=3)
+        for i in range(5):
+            cache.set('local', 'llama3', f'prompt {i}', f'R{i}', parts=(f'transcript {i}', ''))
+
+        assert len(cache._semantic_keys) == 3
+        assert cache._semantic_key_set == set(cache._semantic_keys)
+        conn = sqlite3.connect(cache.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM rewrite_cache").fetchone()[0] == 3
+        conn.close()
+    print("  PASS")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 50)
+    print("REWRITE CACHE TESTS")
+    print("=" * 50)
+
+    test_exact_hit_and_miss()
+    test_semantic_scope()
+    test_persistence()
+    test_scope_migration()
+    test_eviction()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()
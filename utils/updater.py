@@ -160,9 +160,10 @@ def run_update():
     repo_dir = Path(__file__).parent.parent
 
     try:
-        # First, check if we're in a git repo
+        # First, check if we're in a git repo (rev-parse answers without
+        # scanning the working tree the way `git status` does)
         result = subprocess.run(
-            ["git", "status"],
+            ["git", "rev-parse", "--is-inside-work-tree"],
             cwd=repo_dir,
             capture_output=True,
             text=True,